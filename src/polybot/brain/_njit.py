@@ -0,0 +1,20 @@
+"""Optional numba JIT (pip install polybot[performance]).
+
+Without numba, `njit` leaves functions as plain Python; callers should check
+HAS_NUMBA and prefer a NumPy formulation for the fallback.
+"""
+
+try:
+    from numba import njit
+
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+__all__ = ["HAS_NUMBA", "njit"]
@@ -1,5 +1,7 @@
 """Expected Value calculation - the core of the trading logic."""
 
+from datetime import datetime, timezone
+
 from polybot.brain.models import (
     IndicatorSignal,
     Signal,
@@ -228,8 +230,6 @@ def generate_signal(
     Returns:
         Complete Signal object with trade decision
     """
-    from datetime import datetime, timezone
-
     if timestamp is None:
         timestamp = datetime.now(timezone.utc)
 
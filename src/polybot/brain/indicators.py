@@ -1,11 +1,32 @@
 """Technical indicators calculation."""
 
+import math
+from collections.abc import Callable
+
+import numpy as np
 import pandas as pd
 import pandas_ta as ta
 
 from polybot.brain.models import IndicatorSignal, TradeDirection
 
 
+def _insufficient_data(name: str, value: float) -> IndicatorSignal:
+    return IndicatorSignal(
+        name=name,
+        value=value,
+        interpretation="Données insuffisantes",
+        direction_bias=None,
+        strength=0.0,
+    )
+
+
+def _series_or_nan(series: pd.Series | None, index: pd.Index) -> pd.Series:
+    """pandas-ta returns None when there are fewer rows than the period."""
+    if series is None:
+        return pd.Series(np.nan, index=index)
+    return series
+
+
 def calculate_rsi(df: pd.DataFrame, period: int = 14) -> IndicatorSignal:
     """
     Calculate RSI (Relative Strength Index).
@@ -19,8 +40,17 @@ def calculate_rsi(df: pd.DataFrame, period: int = 14) -> IndicatorSignal:
     - RSI élevé = force → continue UP
     - RSI bas = faiblesse → continue DOWN
     """
-    rsi_series = ta.rsi(df["close"], length=period)
-    rsi_value = rsi_series.iloc[-1] if not rsi_series.empty else 50.0
+    return _rsi_signal(**_rsi_components(df["close"], period).iloc[-1])
+
+
+def _rsi_components(close: pd.Series, period: int = 14) -> pd.DataFrame:
+    rsi = _series_or_nan(ta.rsi(close, length=period), close.index)
+    return pd.DataFrame({"rsi_value": rsi}, index=close.index)
+
+
+def _rsi_signal(rsi_value: float) -> IndicatorSignal:
+    if math.isnan(rsi_value):
+        return _insufficient_data("RSI", 50.0)
 
     # Interpretation for mean reversion - more sensitive thresholds
     if rsi_value < 40:
@@ -56,31 +86,31 @@ def calculate_macd(
     - MACD < Signal line: Momentum baissier → DOWN
     - Croisement récent = signal plus fort
     """
-    macd_df = ta.macd(df["close"], fast=fast, slow=slow, signal=signal)
+    return _macd_signal(**_macd_components(df["close"], fast, slow, signal).iloc[-1])
 
+
+def _macd_components(
+    close: pd.Series, fast: int = 12, slow: int = 26, signal: int = 9
+) -> pd.DataFrame:
+    macd_df = ta.macd(close, fast=fast, slow=slow, signal=signal)
     if macd_df is None or macd_df.empty:
-        return IndicatorSignal(
-            name="MACD",
-            value=0.0,
-            interpretation="Données insuffisantes",
-            direction_bias=None,
-            strength=0.0,
-        )
-
-    macd_col = f"MACD_{fast}_{slow}_{signal}"
-    signal_col = f"MACDs_{fast}_{slow}_{signal}"
-    hist_col = f"MACDh_{fast}_{slow}_{signal}"
-
-    macd_value = macd_df[macd_col].iloc[-1]
-    signal_value = macd_df[signal_col].iloc[-1]
-    histogram = macd_df[hist_col].iloc[-1]
-
-    # Check for recent crossover (last 3 candles)
-    recent_hist = macd_df[hist_col].iloc[-3:]
-    crossover = (recent_hist.iloc[0] < 0 < recent_hist.iloc[-1]) or (
-        recent_hist.iloc[0] > 0 > recent_hist.iloc[-1]
+        hist = pd.Series(np.nan, index=close.index)
+    else:
+        hist = macd_df[f"MACDh_{fast}_{slow}_{signal}"]
+
+    # Histogram 2 candles back, to spot a recent crossover (last 3 candles)
+    return pd.DataFrame(
+        {"histogram": hist, "histogram_prev": hist.shift(2), "price": close},
+        index=close.index,
     )
 
+
+def _macd_signal(histogram: float, histogram_prev: float, price: float) -> IndicatorSignal:
+    if math.isnan(histogram):
+        return _insufficient_data("MACD", 0.0)
+
+    crossover = (histogram_prev < 0 < histogram) or (histogram_prev > 0 > histogram)
+
     if histogram > 0:
         interpretation = "Momentum haussier"
         if crossover:
@@ -94,7 +124,6 @@ def calculate_macd(
 
     # Strength based on histogram magnitude (normalized by price percentage)
     # Use percentage of price to normalize across different price levels
-    price = df["close"].iloc[-1]
     histogram_pct = abs(histogram) / price * 100  # As percentage
     strength = min(1.0, histogram_pct * 2)  # 0.5% move = strength 1.0
     if crossover:
@@ -118,33 +147,27 @@ def calculate_bollinger(df: pd.DataFrame, period: int = 20, std: float = 2.0) ->
     - Prix proche de la bande haute: Risque de repli → DOWN
     - Prix au milieu: Zone neutre
     """
-    bb = ta.bbands(df["close"], length=period, std=std)
+    return _bollinger_signal(**_bollinger_components(df["close"], period, std).iloc[-1])
 
+
+def _bollinger_components(close: pd.Series, period: int = 20, std: float = 2.0) -> pd.DataFrame:
+    bb = ta.bbands(close, length=period, std=std)
     if bb is None or bb.empty:
-        return IndicatorSignal(
-            name="Bollinger",
-            value=0.5,
-            interpretation="Données insuffisantes",
-            direction_bias=None,
-            strength=0.0,
-        )
+        return pd.DataFrame({"position": np.nan}, index=close.index)
 
     # Find columns dynamically (pandas-ta uses different formats)
-    lower_col = [c for c in bb.columns if c.startswith("BBL")][0]
-    mid_col = [c for c in bb.columns if c.startswith("BBM")][0]
-    upper_col = [c for c in bb.columns if c.startswith("BBU")][0]
-
-    current_price = df["close"].iloc[-1]
-    lower = bb[lower_col].iloc[-1]
-    middle = bb[mid_col].iloc[-1]
-    upper = bb[upper_col].iloc[-1]
+    lower = bb[[c for c in bb.columns if c.startswith("BBL")][0]]
+    upper = bb[[c for c in bb.columns if c.startswith("BBU")][0]]
 
     # Calculate position within bands (0 = lower, 0.5 = middle, 1 = upper)
     band_width = upper - lower
-    if band_width > 0:
-        position = (current_price - lower) / band_width
-    else:
-        position = 0.5
+    position = ((close - lower) / band_width).where(band_width > 0, 0.5)
+    return pd.DataFrame({"position": position.where(band_width.notna())}, index=close.index)
+
+
+def _bollinger_signal(position: float) -> IndicatorSignal:
+    if math.isnan(position):
+        return _insufficient_data("Bollinger", 0.5)
 
     if position < 0.35:
         interpretation = f"Proche bande basse ({position:.0%})"
@@ -176,25 +199,34 @@ def calculate_ema_cross(df: pd.DataFrame, fast: int = 9, slow: int = 21) -> Indi
     - EMA rapide > EMA lente: Tendance haussière → UP
     - EMA rapide < EMA lente: Tendance baissière → DOWN
     """
-    ema_fast = ta.ema(df["close"], length=fast)
-    ema_slow = ta.ema(df["close"], length=slow)
-
-    if ema_fast is None or ema_slow is None:
-        return IndicatorSignal(
-            name="EMA Cross",
-            value=0.0,
-            interpretation="Données insuffisantes",
-            direction_bias=None,
-            strength=0.0,
-        )
-
-    fast_val = ema_fast.iloc[-1]
-    slow_val = ema_slow.iloc[-1]
+    return _ema_cross_signal(**_ema_cross_components(df["close"], fast, slow).iloc[-1])
+
+
+def _ema_cross_components(close: pd.Series, fast: int = 9, slow: int = 21) -> pd.DataFrame:
+    ema_fast = _series_or_nan(ta.ema(close, length=fast), close.index)
+    ema_slow = _series_or_nan(ta.ema(close, length=slow), close.index)
+
+    # EMAs 2 candles back, to spot a recent crossover
+    return pd.DataFrame(
+        {
+            "fast_val": ema_fast,
+            "slow_val": ema_slow,
+            "fast_prev": ema_fast.shift(2),
+            "slow_prev": ema_slow.shift(2),
+        },
+        index=close.index,
+    )
+
+
+def _ema_cross_signal(
+    fast_val: float, slow_val: float, fast_prev: float, slow_prev: float
+) -> IndicatorSignal:
+    if math.isnan(fast_val) or math.isnan(slow_val):
+        return _insufficient_data("EMA Cross", 0.0)
+
     diff_pct = (fast_val - slow_val) / slow_val * 100
 
     # Check for recent crossover
-    fast_prev = ema_fast.iloc[-3]
-    slow_prev = ema_slow.iloc[-3]
     crossover = (fast_prev < slow_prev and fast_val > slow_val) or (
         fast_prev > slow_prev and fast_val < slow_val
     )
@@ -231,6 +263,14 @@ INDICATOR_FUNCTIONS = {
     "ema_cross": calculate_ema_cross,
 }
 
+# Full-series components and the signal built from one row of them
+INDICATOR_COMPONENTS = {
+    "rsi": (_rsi_components, _rsi_signal),
+    "macd": (_macd_components, _macd_signal),
+    "bollinger": (_bollinger_components, _bollinger_signal),
+    "ema_cross": (_ema_cross_components, _ema_cross_signal),
+}
+
 
 def calculate_indicators(
     df: pd.DataFrame, indicator_configs: list[dict]
@@ -259,3 +299,84 @@ def calculate_indicators(
             signals.append(signal)
 
     return signals
+
+
+def calculate_indicators_full(
+    df: pd.DataFrame, indicator_configs: list[dict]
+) -> pd.DataFrame:
+    """
+    Calculate all enabled indicators over the whole series in one pass.
+
+    Rolling indicators only look backwards, so row i holds what the indicator
+    showed at candle i. Use indicator_signals_at to read the signals of a row.
+
+    Args:
+        df: OHLCV DataFrame with columns: open, high, low, close, volume
+        indicator_configs: List of indicator configurations
+
+    Returns:
+        DataFrame aligned with df.index, columns (indicator name, component)
+    """
+    frames = {}
+
+    for config in indicator_configs:
+        if not config.get("enabled", True):
+            continue
+
+        name = config["name"].lower()
+        params = config.get("params", {})
+
+        if name in INDICATOR_COMPONENTS:
+            components, _ = INDICATOR_COMPONENTS[name]
+            frames[name] = components(df["close"], **params)
+
+    if not frames:
+        return pd.DataFrame(index=df.index)
+    return pd.concat(frames, axis=1)
+
+
+def first_ready_row(full: pd.DataFrame) -> int:
+    """
+    Row position of the first candle where at least one indicator has data.
+
+    Before it every signal is "Données insuffisantes", so no trade can fire.
+    Returns len(full) if no indicator ever warms up.
+    """
+    ready = np.zeros(len(full), dtype=bool)
+    for name in full.columns.unique(level=0):
+        # The first component is the one each signal checks for NaN
+        ready |= full[name].iloc[:, 0].notna().to_numpy()
+
+    hits = np.flatnonzero(ready)
+    return int(hits[0]) if hits.size else len(full)
+
+
+def resolve_indicator_signals(
+    full: pd.DataFrame,
+) -> list[tuple[Callable[..., IndicatorSignal], tuple[str, ...], np.ndarray]]:
+    """
+    Resolve each indicator of a calculate_indicators_full frame once.
+
+    Returns (signal function, component names, component values) per
+    indicator, so reading a row is a numpy index instead of a pandas lookup.
+    """
+    return [
+        (INDICATOR_COMPONENTS[name][1], tuple(full[name].columns), full[name].to_numpy())
+        for name in full.columns.unique(level=0)
+    ]
+
+
+def resolved_signals_at(
+    resolved: list[tuple[Callable[..., IndicatorSignal], tuple[str, ...], np.ndarray]],
+    pos: int,
+) -> list[IndicatorSignal]:
+    """Indicator signals at row position `pos`, from resolve_indicator_signals."""
+    return [
+        signal(**dict(zip(names, values[pos].tolist())))
+        for signal, names, values in resolved
+    ]
+
+
+def indicator_signals_at(full: pd.DataFrame, pos: int) -> list[IndicatorSignal]:
+    """Indicator signals at row position `pos` of a calculate_indicators_full frame."""
+    return resolved_signals_at(resolve_indicator_signals(full), pos)
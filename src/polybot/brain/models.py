@@ -56,6 +56,11 @@ class StrategyConfig(BaseModel):
     # Thresholds
     min_ev: float = Field(default=0.08, ge=0.0, le=1.0, description="Minimum expected value (8% = 0.08)")
     min_confidence: float = Field(default=0.65, ge=0.5, le=1.0, description="Minimum confidence level")
+    min_volatility_bps: float = Field(
+        default=0.0,
+        ge=0.0,
+        description="Skip backtest windows whose last move is below this (basis points)",
+    )
 
     # Indicators
     indicators: list[IndicatorConfig] = Field(default_factory=list)
@@ -250,6 +255,11 @@ class PaperPosition(BaseModel):
     realized_pnl: float | None = None
     realized_pnl_pct: float | None = None
 
+    @property
+    def potential_win(self) -> float:
+        """Profit if the market resolves our way: the stake buys 1/entry_odds shares."""
+        return self.stake * (1 - self.entry_odds) / self.entry_odds
+
 
 class PaperTradingSession(BaseModel):
     """A paper trading session with real Polymarket data."""
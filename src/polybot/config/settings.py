@@ -35,6 +35,8 @@ class Settings(BaseSettings):
     # AI Tutor
     ai_model: str = "claude-opus-4-5-20251101"
     ai_max_tokens: int = 2048
+    ai_cache_ttl_hours: float = 24.0
+    ai_cache_max_entries: int = 200
 
     # Trading defaults
     default_initial_capital: float = 1000.0
@@ -35,10 +35,11 @@ class CryptoDataClient:
         limit: int,
         start_time: datetime | None,
         end_time: datetime | None,
+        symbol: str = "BTCUSDT",
     ) -> pd.DataFrame | None:
         """Try to fetch from a Binance endpoint."""
         params = {
-            "symbol": "BTCUSDT",
+            "symbol": symbol,
             "interval": interval,
             "limit": min(limit, 1000),
         }
@@ -129,6 +130,7 @@ class CryptoDataClient:
                 interval,
                 start_time,
                 end_time,
+                symbol=symbol,
             )
             if df is not None and not df.empty:
                 self._working_source = "binance"
@@ -141,12 +143,13 @@ class CryptoDataClient:
                 interval,
                 start_time,
                 end_time,
+                symbol=symbol,
             )
             if df is not None and not df.empty:
                 self._working_source = "binance_us"
                 return df
 
-        # Source 3: Fallback to CoinGecko (less granular but always works)
+        # Source 3: Fallback to CoinGecko (less granular but always works; BTC only)
         df = self._try_coingecko(days)
         if df is not None and not df.empty:
             self._working_source = "coingecko"
@@ -155,12 +158,38 @@ class CryptoDataClient:
         # If all sources fail, return empty DataFrame
         return pd.DataFrame()
 
+    def get_recent_klines(
+        self,
+        symbol: str = "BTCUSDT",
+        interval: Literal["1m", "5m", "15m", "1h"] = "1m",
+        limit: int = 100,
+    ) -> pd.DataFrame:
+        """
+        Fetch the latest `limit` candles (at most 1000) in a single request.
+
+        Falls back to the last day of get_historical_klines when Binance
+        can't be reached.
+        """
+        for source, base_url in (
+            ("binance", "https://api.binance.com"),
+            ("binance_us", "https://api.binance.us"),
+        ):
+            if self._working_source in (None, source):
+                df = self._try_binance(base_url, interval, limit, None, None, symbol=symbol)
+                if df is not None and not df.empty:
+                    self._working_source = source
+                    return df
+
+        df = self.get_historical_klines(symbol=symbol, interval=interval, days=1)
+        return df.tail(limit).reset_index(drop=True)
+
     def _fetch_binance_historical(
         self,
         base_url: str,
         interval: str,
         start_time: datetime,
         end_time: datetime,
+        symbol: str = "BTCUSDT",
     ) -> pd.DataFrame | None:
         """Fetch historical data from a Binance endpoint."""
         interval_seconds = self.INTERVALS[interval]
@@ -174,6 +203,7 @@ class CryptoDataClient:
                 limit=1000,
                 start_time=current_start,
                 end_time=end_time,
+                symbol=symbol,
             )
 
             if df is None or df.empty:
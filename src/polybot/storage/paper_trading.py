@@ -2,6 +2,7 @@
 
 import json
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 from uuid import uuid4
 
@@ -9,6 +10,29 @@ from polybot.config.settings import get_settings
 from polybot.brain.models import PaperTradingSession
 
 
+@lru_cache(maxsize=256)
+def _read_session_summary(path: Path, mtime_ns: int) -> dict | None:
+    """
+    Summary of one session file, or None if it can't be parsed.
+
+    Keyed on the file's mtime, so list_sessions only re-reads files that changed.
+    """
+    try:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        return {
+            "id": data["id"],
+            "created_at": data["created_at"],
+            "status": data["status"],
+            "total_positions": data.get("total_positions", 0),
+            "resolved_positions": data.get("resolved_positions", 0),
+            "winning_positions": data.get("winning_positions", 0),
+            "total_pnl": data.get("total_pnl", 0),
+        }
+    except (json.JSONDecodeError, KeyError):
+        return None
+
+
 class PaperTradingStore:
     """Store and retrieve paper trading sessions."""
 
@@ -31,12 +55,14 @@ class PaperTradingStore:
         return f"POS-{uuid4().hex[:8]}"
 
     def save(self, session: PaperTradingSession) -> str:
-        """Save a paper trading session."""
-        path = self._get_path(session.id)
-        data = session.model_dump(mode="json")
+        """
+        Save a paper trading session.
 
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, default=str)
+        Serialised in one step by pydantic: the page saves the whole session
+        on every trade and resolution, so this cost grows with its history.
+        """
+        path = self._get_path(session.id)
+        path.write_text(session.model_dump_json(indent=2), encoding="utf-8")
 
         return session.id
 
@@ -68,19 +94,11 @@ class PaperTradingStore:
         sessions = []
         for path in sorted(self.storage_dir.glob("PAPER-*.json"), reverse=True):
             try:
-                with open(path, encoding="utf-8") as f:
-                    data = json.load(f)
-                sessions.append({
-                    "id": data["id"],
-                    "created_at": data["created_at"],
-                    "status": data["status"],
-                    "total_positions": data.get("total_positions", 0),
-                    "resolved_positions": data.get("resolved_positions", 0),
-                    "winning_positions": data.get("winning_positions", 0),
-                    "total_pnl": data.get("total_pnl", 0),
-                })
-            except (json.JSONDecodeError, KeyError):
+                summary = _read_session_summary(path, path.stat().st_mtime_ns)
+            except FileNotFoundError:
                 continue
+            if summary is not None:
+                sessions.append(dict(summary))
         return sessions
 
     def delete(self, session_id: str) -> bool:
@@ -2,14 +2,59 @@
 
 import json
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Iterator
 from uuid import uuid4
 
-from polybot.brain.models import Simulation, SimulationMetrics, StrategyConfig, Trade
+import pandas as pd
+
+from polybot.brain.models import (
+    IndicatorSignal,
+    Simulation,
+    SimulationMetrics,
+    StrategyConfig,
+    Trade,
+)
 from polybot.config.settings import get_settings
 
 
+@lru_cache(maxsize=1024)
+def _read_summary(path: Path, mtime_ns: int) -> dict | None:
+    """
+    Summary of one simulation file, or None if it can't be parsed.
+
+    Keyed on the file's mtime, so list_all only re-reads files that changed.
+    """
+    try:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+
+        initial_cap = data["initial_capital"]
+        final_cap = data["final_capital"]
+
+        # Handle accuracy-only simulations (initial_capital = 0)
+        if initial_cap > 0:
+            pnl_pct = (final_cap - initial_cap) / initial_cap * 100
+        else:
+            pnl_pct = data["metrics"]["win_rate"] * 100  # Use win_rate as accuracy
+
+        return {
+            "id": data["id"],
+            "created_at": data["created_at"],
+            "strategy_name": data["strategy"]["name"],
+            "approach": data["strategy"]["approach"],
+            "initial_capital": initial_cap,
+            "final_capital": final_cap,
+            "pnl": final_cap - initial_cap,
+            "pnl_pct": pnl_pct,
+            "total_trades": data["metrics"]["total_trades"],
+            "win_rate": data["metrics"]["win_rate"],
+        }
+    except (json.JSONDecodeError, KeyError):
+        return None
+
+
 class SimulationStore:
     """Store and retrieve simulation results."""
 
@@ -21,6 +66,9 @@ class SimulationStore:
     def _get_path(self, sim_id: str) -> Path:
         return self.storage_dir / f"{sim_id}.json"
 
+    def _get_trades_path(self, sim_id: str) -> Path:
+        return self.storage_dir / f"{sim_id}.trades.parquet"
+
     def generate_id(self) -> str:
         """Generate a new simulation ID."""
         timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
@@ -31,20 +79,85 @@ class SimulationStore:
         """
         Save a simulation to storage.
 
+        If its trades already have a Parquet side-car (see save_parquet), only
+        the header is rewritten: trades never change after the backtest, so
+        re-saving e.g. an AI explanation doesn't re-serialise them.
+
         Args:
             simulation: The simulation to save
 
         Returns:
             The simulation ID
         """
-        path = self._get_path(simulation.id)
-        data = simulation.model_dump(mode="json")
+        trades_path = self._get_trades_path(simulation.id)
+        if trades_path.exists():
+            self._write_header(simulation, trades_path)
+        else:
+            path = self._get_path(simulation.id)
+            path.write_text(simulation.model_dump_json(indent=2), encoding="utf-8")
+
+        return simulation.id
+
+    def _write_header(self, simulation: Simulation, trades_path: Path) -> None:
+        """Write the simulation without its trades, pointing at the side-car."""
+        data = simulation.model_dump(mode="json", exclude={"trades"})
+        data["trades_file"] = trades_path.name
 
-        with open(path, "w", encoding="utf-8") as f:
+        with open(self._get_path(simulation.id), "w", encoding="utf-8") as f:
             json.dump(data, f, indent=2, default=str)
 
+    def save_parquet(self, simulation: Simulation, trades_df: pd.DataFrame) -> str:
+        """
+        Save a backtest with its trades as a Parquet side-car.
+
+        The JSON file keeps the header (strategy, metrics, ...) so list_all
+        stays cheap; the trades are written column-wise from the run_backtest
+        frame instead of being dumped one model at a time. Falls back to
+        save() when pyarrow is not installed.
+
+        Args:
+            simulation: The simulation to save
+            trades_df: The run_backtest frame the simulation was built from
+
+        Returns:
+            The simulation ID
+        """
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            return self.save(simulation)
+
+        trades_path = self._get_trades_path(simulation.id)
+        frame = trades_df.assign(
+            direction=trades_df["direction"].astype(str),
+            indicator_signals=[
+                json.dumps([s.model_dump(mode="json") for s in signals])
+                for signals in trades_df["indicator_signals"]
+            ],
+        )
+        frame.to_parquet(trades_path, compression="zstd", index=False)
+        self._write_header(simulation, trades_path)
+
         return simulation.id
 
+    def _read(self, path: Path) -> Simulation:
+        """Parse a simulation file, pulling trades from its Parquet side-car if any."""
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+
+        trades_file = data.pop("trades_file", None)
+        if trades_file:
+            from polybot.brain.backtest import build_trades
+
+            frame = pd.read_parquet(self.storage_dir / trades_file)
+            frame["indicator_signals"] = [
+                [IndicatorSignal.model_validate(s) for s in json.loads(signals)]
+                for signals in frame["indicator_signals"]
+            ]
+            data["trades"] = build_trades(frame, data["id"])
+
+        return Simulation.model_validate(data)
+
     def load(self, sim_id: str) -> Simulation | None:
         """
         Load a simulation by ID.
@@ -59,10 +172,7 @@ class SimulationStore:
         if not path.exists():
             return None
 
-        with open(path, encoding="utf-8") as f:
-            data = json.load(f)
-
-        return Simulation.model_validate(data)
+        return self._read(path)
 
     def list_all(self) -> list[dict]:
         """
@@ -75,32 +185,11 @@ class SimulationStore:
 
         for path in sorted(self.storage_dir.glob("SIM-*.json"), reverse=True):
             try:
-                with open(path, encoding="utf-8") as f:
-                    data = json.load(f)
-
-                initial_cap = data["initial_capital"]
-                final_cap = data["final_capital"]
-
-                # Handle accuracy-only simulations (initial_capital = 0)
-                if initial_cap > 0:
-                    pnl_pct = (final_cap - initial_cap) / initial_cap * 100
-                else:
-                    pnl_pct = data["metrics"]["win_rate"] * 100  # Use win_rate as accuracy
-
-                summaries.append({
-                    "id": data["id"],
-                    "created_at": data["created_at"],
-                    "strategy_name": data["strategy"]["name"],
-                    "approach": data["strategy"]["approach"],
-                    "initial_capital": initial_cap,
-                    "final_capital": final_cap,
-                    "pnl": final_cap - initial_cap,
-                    "pnl_pct": pnl_pct,
-                    "total_trades": data["metrics"]["total_trades"],
-                    "win_rate": data["metrics"]["win_rate"],
-                })
-            except (json.JSONDecodeError, KeyError):
+                summary = _read_summary(path, path.stat().st_mtime_ns)
+            except FileNotFoundError:
                 continue
+            if summary is not None:
+                summaries.append(dict(summary))
 
         return summaries
 
@@ -109,6 +198,7 @@ class SimulationStore:
         path = self._get_path(sim_id)
         if path.exists():
             path.unlink()
+            self._get_trades_path(sim_id).unlink(missing_ok=True)
             return True
         return False
 
@@ -116,26 +206,23 @@ class SimulationStore:
         """Iterate over all simulations."""
         for path in self.storage_dir.glob("SIM-*.json"):
             try:
-                with open(path, encoding="utf-8") as f:
-                    data = json.load(f)
-                yield Simulation.model_validate(data)
-            except (json.JSONDecodeError, KeyError):
+                yield self._read(path)
+            except (json.JSONDecodeError, KeyError, OSError):
                 continue
 
     def get_stats(self) -> dict:
-        """Get aggregate statistics across all simulations."""
-        total_sims = 0
-        total_trades = 0
-        total_pnl = 0.0
-        winning_sims = 0
-
-        for sim in self.iter_all():
-            total_sims += 1
-            total_trades += sim.metrics.total_trades
-            pnl = sim.final_capital - sim.initial_capital
-            total_pnl += pnl
-            if pnl > 0:
-                winning_sims += 1
+        """
+        Get aggregate statistics across all simulations.
+
+        Built from the list_all summaries, so pages calling this on every
+        rerun only re-read simulation files that changed.
+        """
+        simulations = self.list_all()
+
+        total_sims = len(simulations)
+        total_trades = sum(s["total_trades"] for s in simulations)
+        total_pnl = sum(s["pnl"] for s in simulations)
+        winning_sims = sum(1 for s in simulations if s["pnl"] > 0)
 
         return {
             "total_simulations": total_sims,
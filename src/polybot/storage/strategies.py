@@ -2,6 +2,7 @@
 
 import json
 from datetime import datetime, timezone
+from operator import attrgetter
 from pathlib import Path
 from uuid import uuid4
 
@@ -74,7 +75,7 @@ class StrategyStore:
         strategies = self.list_all()
 
         # Sort by average P&L percentage (best first)
-        strategies.sort(key=lambda s: s.avg_pnl_pct, reverse=True)
+        strategies.sort(key=attrgetter("avg_pnl_pct"), reverse=True)
 
         leaderboard = []
         for rank, s in enumerate(strategies, 1):
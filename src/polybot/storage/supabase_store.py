@@ -46,6 +46,10 @@ class SupabaseSimulationStore:
         self.client.table(self.table).upsert(data).execute()
         return simulation.id
 
+    def save_parquet(self, simulation, trades_df) -> str:
+        """Save a backtest; Supabase keeps trades inline, so this is save()."""
+        return self.save(simulation)
+
     def load(self, sim_id: str):
         """Load a simulation by ID."""
         if not self.client:
@@ -1,5 +1,11 @@
 """AI Tutor module for pedagogical explanations."""
 
-from polybot.tutor.explainer import SimulationExplainer
-
 __all__ = ["SimulationExplainer"]
+
+
+def __getattr__(name: str):
+    # Lazy so that importing polybot.tutor.prompts does not pull in the anthropic SDK
+    if name == "SimulationExplainer":
+        from polybot.tutor.explainer import SimulationExplainer
+        return SimulationExplainer
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
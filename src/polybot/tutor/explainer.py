@@ -1,7 +1,10 @@
 """AI-powered explanation generator for simulation results."""
 
+import hashlib
 import json
+import time
 from datetime import datetime
+from pathlib import Path
 
 from anthropic import Anthropic
 
@@ -11,6 +14,7 @@ from polybot.storage.knowledge import Insight, InsightStore
 from polybot.tutor.prompts import (
     EXPLAIN_RESULTS_PROMPT,
     GENERATE_INSIGHTS_PROMPT,
+    INSIGHTS_TOOL,
     PARAMETER_EXPLANATION,
     TOOLTIPS,
 )
@@ -24,24 +28,109 @@ class SimulationExplainer:
         self.api_key = api_key or settings.anthropic_api_key
         self.model = settings.ai_model
         self.max_tokens = settings.ai_max_tokens
+        self.cache_dir = settings.cache_dir / "tutor"
+        self.cache_ttl = settings.ai_cache_ttl_hours * 3600
+        self.cache_max_entries = settings.ai_cache_max_entries
 
         if self.api_key:
             self.client = Anthropic(api_key=self.api_key)
         else:
             self.client = None
 
+    def _cache_path(self, prompt: str, suffix: str) -> Path:
+        """Disk cache entry for a prompt under the current model and max_tokens."""
+        key = hashlib.sha256(f"{self.model}\n{self.max_tokens}\n{prompt}".encode()).hexdigest()
+        return self.cache_dir / f"{key}{suffix}"
+
+    def _read_cache(self, path: Path) -> str | None:
+        """
+        A cached answer, if younger than the cache TTL.
+
+        Answers are sampled, so a cached one is only a recent answer to the
+        prompt, not the answer; expired entries are deleted and regenerated.
+        """
+        try:
+            age = time.time() - path.stat().st_mtime
+        except FileNotFoundError:
+            return None
+        if age > self.cache_ttl:
+            path.unlink(missing_ok=True)
+            return None
+        return path.read_text(encoding="utf-8")
+
+    def _write_cache(self, path: Path, text: str) -> None:
+        """Store an answer, keeping only the cache_max_entries most recent ones."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text, encoding="utf-8")
+
+        try:
+            entries = sorted(
+                self.cache_dir.iterdir(), key=lambda p: p.stat().st_mtime, reverse=True
+            )
+        except FileNotFoundError:
+            return  # Another session is pruning at the same time
+        for old in entries[self.cache_max_entries:]:
+            old.unlink(missing_ok=True)
+
+    def clear_cache(self) -> int:
+        """Delete every cached answer; returns how many were removed."""
+        if not self.cache_dir.exists():
+            return 0
+        removed = 0
+        for path in self.cache_dir.iterdir():
+            path.unlink(missing_ok=True)
+            removed += 1
+        return removed
+
     def _call_api(self, prompt: str) -> str:
-        """Make an API call to Claude."""
+        """Make an API call to Claude (cached on disk per prompt)."""
         if not self.client:
             return self._fallback_explanation()
 
+        path = self._cache_path(prompt, ".md")
+        cached = self._read_cache(path)
+        if cached is not None:
+            return cached
+
         response = self.client.messages.create(
             model=self.model,
             max_tokens=self.max_tokens,
             messages=[{"role": "user", "content": prompt}],
         )
+        text = response.content[0].text
 
-        return response.content[0].text
+        # A truncated answer is returned but not kept
+        if response.stop_reason != "max_tokens":
+            self._write_cache(path, text)
+        return text
+
+    def _call_api_tool(self, prompt: str, tool: dict) -> dict:
+        """
+        Make an API call to Claude forcing a structured tool call.
+
+        Returns the tool call's input (cached on disk per tool and prompt).
+        """
+        path = self._cache_path(f"{tool['name']}\n{prompt}", ".json")
+        cached = self._read_cache(path)
+        if cached is not None:
+            return json.loads(cached)
+
+        response = self.client.messages.create(
+            model=self.model,
+            max_tokens=self.max_tokens,
+            tools=[tool],
+            tool_choice={"type": "tool", "name": tool["name"]},
+            messages=[{"role": "user", "content": prompt}],
+        )
+
+        data = next((block.input for block in response.content if block.type == "tool_use"), None)
+        if data is None:
+            # No tool call: don't cache, so the next call asks again
+            return {}
+
+        if response.stop_reason != "max_tokens":
+            self._write_cache(path, json.dumps(data))
+        return data
 
     def _fallback_explanation(self) -> str:
         """Provide a basic explanation when API is unavailable."""
@@ -146,20 +235,9 @@ En attendant, tu peux toujours:
             existing_insights=existing_summary,
         )
 
-        response = self._call_api(prompt)
-
-        # Parse JSON response
-        try:
-            # Find JSON in response
-            start = response.find("{")
-            end = response.rfind("}") + 1
-            if start >= 0 and end > start:
-                data = json.loads(response[start:end])
-                raw_insights = data.get("insights", [])
-            else:
-                return []
-        except json.JSONDecodeError:
-            return []
+        # Structured output via forced tool call - no JSON parsing needed
+        data = self._call_api_tool(prompt, INSIGHTS_TOOL)
+        raw_insights = data.get("insights", [])
 
         # Create and save insights
         new_insights = []
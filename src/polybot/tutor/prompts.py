@@ -65,25 +65,42 @@ Pour chaque insight, fournis:
 5. **Tags** (liste de mots-clés)
 6. **Expériences suggérées** (pour valider ou approfondir)
 
-Réponds en JSON avec cette structure:
-```json
-{{
-  "insights": [
-    {{
-      "title": "...",
-      "category": "...",
-      "description": "...",
-      "confidence": 0.7,
-      "tags": ["...", "..."],
-      "suggested_experiments": ["...", "..."]
-    }}
-  ]
-}}
-```
+Enregistre tes insights avec l'outil `record_insights`.
 
 Ne génère que des insights NOUVEAUX qui ne dupliquent pas les existants.
 Maximum 3 insights par simulation."""
 
+# Tool schema forcing structured output for GENERATE_INSIGHTS_PROMPT
+INSIGHTS_TOOL = {
+    "name": "record_insights",
+    "description": "Enregistre les insights extraits d'une simulation.",
+    "input_schema": {
+        "type": "object",
+        "properties": {
+            "insights": {
+                "type": "array",
+                "maxItems": 3,
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "title": {"type": "string"},
+                        "category": {
+                            "type": "string",
+                            "enum": ["indicator", "timing", "risk", "strategy"],
+                        },
+                        "description": {"type": "string"},
+                        "confidence": {"type": "number", "minimum": 0, "maximum": 1},
+                        "tags": {"type": "array", "items": {"type": "string"}},
+                        "suggested_experiments": {"type": "array", "items": {"type": "string"}},
+                    },
+                    "required": ["title", "category", "description", "confidence"],
+                },
+            },
+        },
+        "required": ["insights"],
+    },
+}
+
 PARAMETER_EXPLANATION = """Tu es un guide pédagogique qui explique les paramètres de trading à un débutant.
 
 ## PARAMÈTRE À EXPLIQUER
@@ -125,6 +142,14 @@ TOOLTIPS = {
                   "Plus c'est haut, moins de trades mais mieux fondés. "
                   "Recommandé: 60-70% pour débuter.",
     },
+    "min_volatility_bps": {
+        "name": "Volatilité Minimum",
+        "simple": "Ignore les fenêtres où le prix a trop peu bougé (backtest uniquement).",
+        "detail": "En points de base (1 bps = 0,01%). Avec 5 bps, le backtest saute les fenêtres "
+                  "où BTC a bougé de moins de 0,05% depuis la fenêtre précédente: "
+                  "dans un marché plat, la direction tient surtout du hasard. "
+                  "0 = aucune fenêtre ignorée.",
+    },
     "max_position_pct": {
         "name": "Taille de Position Max",
         "simple": "Le pourcentage maximum de ton capital par trade.",
@@ -0,0 +1,31 @@
+"""ASGI entry point with a start-up warm-up hook (st.App, Streamlit >= 1.57).
+
+Lancer avec: uv run --extra asgi uvicorn polybot.ui.asgi:app --port 8501
+"""
+
+from contextlib import asynccontextmanager
+from pathlib import Path
+
+import streamlit as st
+
+if not hasattr(st, "App"):
+    raise ImportError(
+        f"polybot.ui.asgi needs st.App (Streamlit >= 1.57), found Streamlit {st.__version__}. "
+        "Install the 'asgi' extra, or run: streamlit run src/polybot/ui/app.py"
+    )
+
+
+@asynccontextmanager
+async def lifespan(app):
+    """Import the heavy modules and build the presets before the first session."""
+    import polybot.brain.backtest  # noqa: F401  (compiles the numba kernels)
+    import polybot.brain.ev_calculator  # noqa: F401
+    import polybot.brain.indicators  # noqa: F401
+    from polybot.config.presets import get_preset, list_presets
+
+    for preset in list_presets():
+        get_preset(preset["id"])
+    yield
+
+
+app = st.App(Path(__file__).with_name("app.py"), lifespan=lifespan)
@@ -0,0 +1,53 @@
+"""Chart helpers shared by the result pages."""
+
+import numpy as np
+
+# Line charts with more points than this are downsampled before plotting
+MAX_CHART_POINTS = 2000
+
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, n_out: int = MAX_CHART_POINTS) -> np.ndarray:
+    """
+    Indices of the points kept by Largest-Triangle-Three-Buckets downsampling.
+
+    Keeps the first and last points and, in each of n_out - 2 buckets, the
+    point forming the largest triangle with the previously kept point and the
+    mean of the next bucket, so peaks and dips survive.
+
+    Args:
+        x: Numeric, increasing x values (e.g. timestamps as int64)
+        y: Values to plot
+        n_out: Number of points to keep
+
+    Returns:
+        Sorted indices into x/y (all of them if len(x) <= n_out)
+    """
+    n = len(y)
+    if n <= n_out or n_out < 3:
+        return np.arange(n)
+
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+
+    # Bucket boundaries over the interior points 1..n-2
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.intp)
+    kept = np.empty(n_out, dtype=np.intp)
+    kept[0] = 0
+    kept[-1] = n - 1
+
+    a = 0
+    for b in range(n_out - 2):
+        start, stop = edges[b], edges[b + 1]
+        # Mean of the next bucket (the last point for the final bucket)
+        next_stop = edges[b + 2] if b + 2 < len(edges) else n
+        next_x = x[stop:next_stop].mean()
+        next_y = y[stop:next_stop].mean()
+
+        area = np.abs(
+            (x[a] - next_x) * (y[start:stop] - y[a])
+            - (x[a] - x[start:stop]) * (next_y - y[a])
+        )
+        a = start + int(area.argmax())
+        kept[b + 1] = a
+
+    return kept
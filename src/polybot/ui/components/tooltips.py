@@ -1,19 +1,30 @@
 """Tooltip components for pedagogical UI."""
 
+from functools import lru_cache
+
 import streamlit as st
 
 from polybot.tutor.prompts import TOOLTIPS
 
 
-def render_tooltip(param_name: str) -> None:
-    """Render an expandable tooltip for a parameter."""
+@lru_cache(maxsize=None)
+def _tooltip_markdown(param_name: str) -> tuple[str, str] | None:
+    """Build (expander label, markdown body) for a parameter tooltip."""
     tooltip = TOOLTIPS.get(param_name.lower())
     if not tooltip:
+        return None
+    return f"ℹ️ {tooltip['name']}", f"**En bref:** {tooltip['simple']}\n\n{tooltip['detail']}"
+
+
+def render_tooltip(param_name: str) -> None:
+    """Render an expandable tooltip for a parameter."""
+    content = _tooltip_markdown(param_name)
+    if not content:
         return
 
-    with st.expander(f"ℹ️ {tooltip['name']}", expanded=False):
-        st.markdown(f"**En bref:** {tooltip['simple']}")
-        st.markdown(tooltip['detail'])
+    label, body = content
+    with st.expander(label, expanded=False):
+        st.markdown(body)
 
 
 def render_inline_help(param_name: str) -> str:
@@ -24,60 +35,61 @@ def render_inline_help(param_name: str) -> str:
     return ""
 
 
-def render_strategy_explanation(approach: str) -> None:
-    """Render explanation for a strategy approach."""
-    explanations = {
-        "momentum": """
-        ### 📈 Stratégie Momentum
+STRATEGY_EXPLANATIONS = {
+    "momentum": """
+    ### 📈 Stratégie Momentum
 
-        **Philosophie:** "Ce qui monte continue de monter"
+    **Philosophie:** "Ce qui monte continue de monter"
 
-        Cette approche suit la tendance actuelle. Si le Bitcoin montre des signes
-        de force (RSI élevé, MACD positif), on parie que ça va continuer.
+    Cette approche suit la tendance actuelle. Si le Bitcoin montre des signes
+    de force (RSI élevé, MACD positif), on parie que ça va continuer.
 
-        **Quand ça marche bien:**
-        - Marchés en tendance claire
-        - Mouvements prolongés
+    **Quand ça marche bien:**
+    - Marchés en tendance claire
+    - Mouvements prolongés
 
-        **Risques:**
-        - Retournements soudains
-        - Arriver tard dans la tendance
-        """,
-        "mean_reversion": """
-        ### 📉 Stratégie Mean Reversion
+    **Risques:**
+    - Retournements soudains
+    - Arriver tard dans la tendance
+    """,
+    "mean_reversion": """
+    ### 📉 Stratégie Mean Reversion
 
-        **Philosophie:** "Les excès se corrigent toujours"
+    **Philosophie:** "Les excès se corrigent toujours"
 
-        Cette approche parie sur le retour à la normale. Si le Bitcoin a trop
-        monté (RSI > 70) ou trop baissé (RSI < 30), on parie sur une correction.
+    Cette approche parie sur le retour à la normale. Si le Bitcoin a trop
+    monté (RSI > 70) ou trop baissé (RSI < 30), on parie sur une correction.
 
-        **Quand ça marche bien:**
-        - Marchés en range
-        - Mouvements exagérés
+    **Quand ça marche bien:**
+    - Marchés en range
+    - Mouvements exagérés
 
-        **Risques:**
-        - Tendances fortes qui continuent
-        - "Le marché peut rester irrationnel plus longtemps que toi solvable"
-        """,
-        "auto": """
-        ### 🤖 Mode Auto (IA)
+    **Risques:**
+    - Tendances fortes qui continuent
+    - "Le marché peut rester irrationnel plus longtemps que toi solvable"
+    """,
+    "auto": """
+    ### 🤖 Mode Auto (IA)
 
-        **Philosophie:** "Laisse les données décider"
+    **Philosophie:** "Laisse les données décider"
 
-        Le système analyse les conditions du marché et choisit automatiquement
-        l'approche la plus adaptée (Momentum ou Mean Reversion).
+    Le système analyse les conditions du marché et choisit automatiquement
+    l'approche la plus adaptée (Momentum ou Mean Reversion).
 
-        **Avantages:**
-        - Pas besoin de choisir
-        - S'adapte aux conditions
+    **Avantages:**
+    - Pas besoin de choisir
+    - S'adapte aux conditions
 
-        **Inconvénients:**
-        - Moins de contrôle
-        - Peut être inconsistant
-        """,
-    }
+    **Inconvénients:**
+    - Moins de contrôle
+    - Peut être inconsistant
+    """,
+}
 
-    explanation = explanations.get(approach.lower(), "")
+
+def render_strategy_explanation(approach: str) -> None:
+    """Render explanation for a strategy approach."""
+    explanation = STRATEGY_EXPLANATIONS.get(approach.lower(), "")
     if explanation:
         st.markdown(explanation)
 
@@ -1,5 +1,8 @@
 """Strategy configuration page - Simplified for prediction accuracy."""
 
+from functools import lru_cache
+
+import pandas as pd
 import streamlit as st
 
 from polybot.brain.models import IndicatorConfig, StrategyApproach, StrategyConfig
@@ -9,6 +12,98 @@ from polybot.ui.components.tooltips import render_tooltip, render_strategy_expla
 
 st.set_page_config(page_title="Configure - PolyBot", page_icon="🔧", layout="wide")
 
+APPROACH_OPTIONS = {
+    "Mean Reversion": StrategyApproach.MEAN_REVERSION,
+    "Momentum": StrategyApproach.MOMENTUM,
+    "Auto (IA décide)": StrategyApproach.AUTO,
+}
+_APPROACH_TO_NAME = {v: k for k, v in APPROACH_OPTIONS.items()}
+APPROACH_NAMES = tuple(APPROACH_OPTIONS)
+APPROACH_INDEX = {name: i for i, name in enumerate(APPROACH_NAMES)}
+RSI_PERIODS = (7, 14, 21)
+BOLLINGER_PERIODS = (10, 20, 30)
+
+
+@lru_cache(maxsize=64)
+def _validated_indicator(name: str, params: tuple[tuple[str, float], ...]) -> IndicatorConfig:
+    """Validate (once per distinct params) an enabled IndicatorConfig; never handed out."""
+    return IndicatorConfig(name=name, enabled=True, params=dict(params))
+
+
+def _make_indicator(name: str, params: tuple[tuple[str, float], ...]) -> IndicatorConfig:
+    """An enabled IndicatorConfig of the caller's own (copied, not re-validated)."""
+    return _validated_indicator(name, params).model_copy(deep=True)
+
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def _build_config(
+    name: str,
+    approach: StrategyApproach,
+    min_ev: float,
+    min_confidence: float,
+    min_volatility_bps: float,
+    indicator_specs: tuple[tuple[str, tuple], ...],
+) -> StrategyConfig:
+    """Build (once per distinct widget values) the StrategyConfig; each caller gets a copy."""
+    # Defaults for money-related fields (used by Paper Trading)
+    return StrategyConfig(
+        name=name,
+        approach=approach,
+        min_ev=min_ev,
+        min_confidence=min_confidence,
+        min_volatility_bps=min_volatility_bps,
+        indicators=[_make_indicator(n, params) for n, params in indicator_specs],
+        initial_capital=1000.0,  # Default for paper trading
+        max_position_pct=0.02,   # Default 2%
+    )
+
+
+@lru_cache(maxsize=32)
+def _summary_frame(
+    approach_name: str,
+    min_ev: float,
+    min_confidence: float,
+    min_volatility_bps: float,
+    indicator_names: tuple[str, ...],
+) -> pd.DataFrame:
+    """Pre-formatted summary table (once per distinct widget values)."""
+    active_indicators = ", ".join(name.upper() for name in indicator_names)
+    return pd.DataFrame(
+        [
+            ["Approche", approach_name],
+            ["EV Minimum", f"{min_ev:.0f}%"],
+            ["Confiance Minimum", f"{min_confidence:.0f}%"],
+            ["Volatilité Minimum", f"{min_volatility_bps:.0f} bps"],
+            ["Indicateurs", active_indicators or "Aucun"],
+        ],
+        columns=["Paramètre", "Valeur"],
+    )
+
+
+@st.cache_resource
+def _cached_list_presets() -> list[dict]:
+    return list_presets()
+
+
+@st.cache_resource
+def _cached_get_preset(preset_id: str):
+    return get_preset(preset_id)
+
+
+@st.cache_resource
+def _preset_index() -> dict[str, tuple[int, str]]:
+    """Map preset name -> (position in the list, preset id)."""
+    return {p["name"]: (i, p["id"]) for i, p in enumerate(_cached_list_presets())}
+
+
+@st.cache_resource
+def _config_names() -> dict[str, str]:
+    """Map preset selectbox option -> StrategyConfig name."""
+    return {"Personnalisé": "Stratégie Personnalisée"} | {
+        p["name"]: p["name"] for p in _cached_list_presets()
+    }
+
+
 st.title("🔧 Configure ta Stratégie")
 
 st.markdown("""
@@ -29,15 +124,14 @@ st.divider()
 st.subheader("📦 Stratégies Pré-configurées")
 st.markdown("Choisis une stratégie de base ou personnalise entièrement.")
 
-presets = list_presets()
+presets = _cached_list_presets()
+preset_lookup = _preset_index()
+config_names = _config_names()
 preset_options = ["Personnalisé"] + [p["name"] for p in presets]
 
 default_preset_index = 0
 if saved_config:
-    for i, p in enumerate(presets):
-        if p["name"] == saved_config.name:
-            default_preset_index = i + 1
-            break
+    default_preset_index = preset_lookup.get(saved_config.name, (-1,))[0] + 1
 
 selected_preset = st.selectbox(
     "Commencer avec:",
@@ -47,203 +141,212 @@ selected_preset = st.selectbox(
 )
 
 if selected_preset != "Personnalisé":
-    preset_id = next(p["id"] for p in presets if p["name"] == selected_preset)
-    preset_config, preset_desc = get_preset(preset_id)
+    preset_id = preset_lookup[selected_preset][1]
+    preset_config, preset_desc = _cached_get_preset(preset_id)
     st.info(f"💡 {preset_desc}")
 else:
     preset_config = saved_config
 
+base_config = preset_config or saved_config
+
 st.divider()
 
-# Strategy approach
-st.subheader("📈 Approche de Trading")
 
-col1, col2 = st.columns([2, 1])
+@st.fragment
+def _strategy_form(base_config, selected_preset: str) -> None:
+    """Approach, thresholds, indicators and save - reruns alone on widget changes."""
+    # Strategy approach
+    st.subheader("📈 Approche de Trading")
 
-with col1:
-    approach_options = {
-        "Mean Reversion": StrategyApproach.MEAN_REVERSION,
-        "Momentum": StrategyApproach.MOMENTUM,
-        "Auto (IA décide)": StrategyApproach.AUTO,
-    }
-
-    default_approach = "Mean Reversion"
-    base_config = preset_config or saved_config
-    if base_config:
-        for name, val in approach_options.items():
-            if val == base_config.approach:
-                default_approach = name
-                break
-
-    selected_approach_name = st.radio(
-        "Quelle philosophie de trading ?",
-        list(approach_options.keys()),
-        index=list(approach_options.keys()).index(default_approach),
-        horizontal=True,
-    )
-    selected_approach = approach_options[selected_approach_name]
+    col1, col2 = st.columns([2, 1])
 
-with col2:
-    render_tooltip("approach")
+    with col1:
+        default_approach = "Mean Reversion"
+        if base_config:
+            default_approach = _APPROACH_TO_NAME.get(base_config.approach, "Mean Reversion")
 
-with st.expander("📖 Comprendre cette approche", expanded=False):
-    render_strategy_explanation(selected_approach.value)
+        selected_approach_name = st.radio(
+            "Quelle philosophie de trading ?",
+            APPROACH_NAMES,
+            index=APPROACH_INDEX[default_approach],
+            horizontal=True,
+        )
+        selected_approach = APPROACH_OPTIONS[selected_approach_name]
 
-st.divider()
+    with col2:
+        render_tooltip("approach")
 
-# Thresholds (simplified - only EV and confidence for signal generation)
-st.subheader("🎚️ Seuils de Signal")
+    with st.expander("📖 Comprendre cette approche", expanded=False):
+        render_strategy_explanation(selected_approach.value)
 
-col1, col2 = st.columns(2)
+    st.divider()
 
-with col1:
-    base_config = preset_config or saved_config
-    default_ev = base_config.min_ev * 100 if base_config else 8.0
-    min_ev = st.slider(
-        "EV Minimum (%)",
-        min_value=3.0,
-        max_value=20.0,
-        value=default_ev,
-        step=1.0,
-        help=TOOLTIPS["min_ev"]["simple"],
-    )
-    render_tooltip("min_ev")
-
-with col2:
-    default_conf = base_config.min_confidence * 100 if base_config else 65.0
-    min_confidence = st.slider(
-        "Confiance Minimum (%)",
-        min_value=55.0,
-        max_value=85.0,
-        value=default_conf,
-        step=5.0,
-        help=TOOLTIPS["min_confidence"]["simple"],
-    )
-    render_tooltip("min_confidence")
+    # Thresholds (EV and confidence for signals, volatility for the backtest)
+    st.subheader("🎚️ Seuils de Signal")
 
-st.divider()
+    col1, col2 = st.columns(2)
 
-# Indicators
-st.subheader("📊 Indicateurs Techniques")
-st.markdown("Active les indicateurs que tu veux utiliser. Plus d'indicateurs = plus de filtrage mais moins de signaux.")
-
-def get_preset_indicator(name: str) -> tuple[bool, dict]:
-    base_config = preset_config or saved_config
-    if not base_config:
-        return name in ["rsi", "macd"], {}
-    for ind in base_config.indicators:
-        if ind.name == name:
-            return ind.enabled, ind.params
-    return False, {}
-
-col1, col2 = st.columns(2)
-
-with col1:
-    st.markdown("**RSI (Relative Strength Index)**")
-    rsi_default, rsi_params = get_preset_indicator("rsi")
-    rsi_enabled = st.checkbox("Activer RSI", value=rsi_default)
-    if rsi_enabled:
-        rsi_period = st.select_slider(
-            "Période RSI",
-            options=[7, 14, 21],
-            value=rsi_params.get("period", 14),
-            help="7=réactif, 14=standard, 21=lissé"
+    with col1:
+        default_ev = base_config.min_ev * 100 if base_config else 8.0
+        min_ev = st.slider(
+            "EV Minimum (%)",
+            min_value=3.0,
+            max_value=20.0,
+            value=default_ev,
+            step=1.0,
+            help=TOOLTIPS["min_ev"]["simple"],
         )
-    else:
-        rsi_period = 14
-    render_tooltip("rsi")
-
-with col2:
-    st.markdown("**MACD (Moving Average Convergence Divergence)**")
-    macd_default, macd_params = get_preset_indicator("macd")
-    macd_enabled = st.checkbox("Activer MACD", value=macd_default)
-    render_tooltip("macd")
-
-col1, col2 = st.columns(2)
-
-with col1:
-    st.markdown("**Bandes de Bollinger**")
-    boll_default, boll_params = get_preset_indicator("bollinger")
-    bollinger_enabled = st.checkbox("Activer Bollinger", value=boll_default)
-    if bollinger_enabled:
-        boll_period = st.select_slider(
-            "Période Bollinger",
-            options=[10, 20, 30],
-            value=boll_params.get("period", 20),
+        render_tooltip("min_ev")
+
+    with col2:
+        default_conf = base_config.min_confidence * 100 if base_config else 65.0
+        min_confidence = st.slider(
+            "Confiance Minimum (%)",
+            min_value=55.0,
+            max_value=85.0,
+            value=default_conf,
+            step=5.0,
+            help=TOOLTIPS["min_confidence"]["simple"],
         )
-    else:
-        boll_period = 20
-    render_tooltip("bollinger")
+        render_tooltip("min_confidence")
 
-with col2:
-    st.markdown("**EMA Cross (Croisement de moyennes)**")
-    ema_default, _ = get_preset_indicator("ema_cross")
-    ema_enabled = st.checkbox("Activer EMA Cross", value=ema_default)
+    default_volatility = base_config.min_volatility_bps if base_config else 0.0
+    min_volatility_bps = st.slider(
+        "Volatilité Minimum (bps)",
+        min_value=0.0,
+        max_value=20.0,
+        value=default_volatility,
+        step=1.0,
+        help=TOOLTIPS["min_volatility_bps"]["simple"],
+    )
+    render_tooltip("min_volatility_bps")
 
-st.divider()
+    st.divider()
 
-# Build config
-indicators = []
-if rsi_enabled:
-    indicators.append(IndicatorConfig(name="rsi", enabled=True, params={"period": rsi_period}))
-if macd_enabled:
-    indicators.append(IndicatorConfig(name="macd", enabled=True, params={"fast": 12, "slow": 26, "signal": 9}))
-if bollinger_enabled:
-    indicators.append(IndicatorConfig(name="bollinger", enabled=True, params={"period": boll_period, "std": 2.0}))
-if ema_enabled:
-    indicators.append(IndicatorConfig(name="ema_cross", enabled=True, params={"fast": 9, "slow": 21}))
-
-# Create config with defaults for money-related fields (used by Paper Trading)
-strategy_config = StrategyConfig(
-    name=selected_preset if selected_preset != "Personnalisé" else "Stratégie Personnalisée",
-    approach=selected_approach,
-    min_ev=min_ev / 100,
-    min_confidence=min_confidence / 100,
-    indicators=indicators,
-    initial_capital=1000.0,  # Default for paper trading
-    max_position_pct=0.02,   # Default 2%
-)
+    # Indicators
+    st.subheader("📊 Indicateurs Techniques")
+    st.markdown(
+        "Active les indicateurs que tu veux utiliser. "
+        "Plus d'indicateurs = plus de filtrage mais moins de signaux."
+    )
 
-# Summary
-st.subheader("📋 Résumé de ta Configuration")
+    base_indicators = (
+        {ind.name: (ind.enabled, ind.params) for ind in base_config.indicators}
+        if base_config
+        else None
+    )
 
-col1, col2, col3 = st.columns(3)
+    def get_preset_indicator(name: str) -> tuple[bool, dict]:
+        if base_indicators is None:
+            return name in ("rsi", "macd"), {}
+        return base_indicators.get(name, (False, {}))
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.markdown("**RSI (Relative Strength Index)**")
+        rsi_default, rsi_params = get_preset_indicator("rsi")
+        rsi_enabled = st.checkbox("Activer RSI", value=rsi_default)
+        if rsi_enabled:
+            rsi_period = st.select_slider(
+                "Période RSI",
+                options=RSI_PERIODS,
+                value=rsi_params.get("period", 14),
+                help="7=réactif, 14=standard, 21=lissé"
+            )
+        else:
+            rsi_period = 14
+        render_tooltip("rsi")
+
+    with col2:
+        st.markdown("**MACD (Moving Average Convergence Divergence)**")
+        macd_default, macd_params = get_preset_indicator("macd")
+        macd_enabled = st.checkbox("Activer MACD", value=macd_default)
+        render_tooltip("macd")
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.markdown("**Bandes de Bollinger**")
+        boll_default, boll_params = get_preset_indicator("bollinger")
+        bollinger_enabled = st.checkbox("Activer Bollinger", value=boll_default)
+        if bollinger_enabled:
+            boll_period = st.select_slider(
+                "Période Bollinger",
+                options=BOLLINGER_PERIODS,
+                value=boll_params.get("period", 20),
+            )
+        else:
+            boll_period = 20
+        render_tooltip("bollinger")
+
+    with col2:
+        st.markdown("**EMA Cross (Croisement de moyennes)**")
+        ema_default, _ = get_preset_indicator("ema_cross")
+        ema_enabled = st.checkbox("Activer EMA Cross", value=ema_default)
+
+    st.divider()
+
+    # Build config
+    indicator_specs = tuple(
+        (name, params)
+        for name, params, enabled in (
+            ("rsi", (("period", rsi_period),), rsi_enabled),
+            ("macd", (("fast", 12), ("slow", 26), ("signal", 9)), macd_enabled),
+            ("bollinger", (("period", boll_period), ("std", 2.0)), bollinger_enabled),
+            ("ema_cross", (("fast", 9), ("slow", 21)), ema_enabled),
+        )
+        if enabled
+    )
 
-with col1:
-    st.metric("Approche", selected_approach_name)
+    # StrategyConfig itself is only built when a save button is clicked
+    config_args = (
+        config_names[selected_preset],
+        selected_approach,
+        min_ev / 100,
+        min_confidence / 100,
+        min_volatility_bps,
+        indicator_specs,
+    )
 
-with col2:
-    st.metric("EV Minimum", f"{min_ev:.0f}%")
+    # Summary
+    st.subheader("📋 Résumé de ta Configuration")
 
-with col3:
-    st.metric("Confiance Minimum", f"{min_confidence:.0f}%")
+    summary_df = _summary_frame(
+        selected_approach_name,
+        min_ev,
+        min_confidence,
+        min_volatility_bps,
+        tuple(name for name, _ in indicator_specs),
+    )
+    st.dataframe(summary_df, use_container_width=True, hide_index=True)
 
-col1, col2, col3 = st.columns(3)
+    # Warnings
+    if not indicator_specs:
+        st.warning("Aucun indicateur activé! Ta stratégie n'aura pas de signaux.")
 
-with col1:
-    active_indicators = [i.name.upper() for i in indicators]
-    st.metric("Indicateurs", ", ".join(active_indicators) or "Aucun")
+    if min_ev < 5:
+        st.warning("EV très bas. Tu risques de générer beaucoup de signaux peu fiables.")
 
-# Warnings
-if not indicators:
-    st.warning("Aucun indicateur activé! Ta stratégie n'aura pas de signaux.")
+    # Save button
+    st.divider()
 
-if min_ev < 5:
-    st.warning("EV très bas. Tu risques de générer beaucoup de signaux peu fiables.")
+    col1, col2 = st.columns(2)
 
-# Save button
-st.divider()
+    with col1:
+        if st.button(
+            "🎯 Sauvegarder et aller au Backtest", type="primary", use_container_width=True
+        ):
+            st.session_state.strategy_config = _build_config(*config_args)
+            st.success("Configuration sauvegardée!")
 
-col1, col2 = st.columns(2)
+    with col2:
+        if st.button(
+            "📈 Sauvegarder et aller au Paper Trading", type="secondary", use_container_width=True
+        ):
+            st.session_state.strategy_config = _build_config(*config_args)
+            st.success("Configuration sauvegardée!")
+            st.page_link("pages/6_Paper_Trading_Live.py", label="Aller au Paper Trading", icon="📈")
 
-with col1:
-    if st.button("🎯 Sauvegarder et aller au Backtest", type="primary", use_container_width=True):
-        st.session_state.strategy_config = strategy_config
-        st.success("Configuration sauvegardée!")
-        st.balloons()
 
-with col2:
-    if st.button("📈 Sauvegarder et aller au Paper Trading", type="secondary", use_container_width=True):
-        st.session_state.strategy_config = strategy_config
-        st.success("Configuration sauvegardée!")
-        st.page_link("pages/6_Paper_Trading_Live.py", label="Aller au Paper Trading", icon="📈")
+_strategy_form(base_config, selected_preset)
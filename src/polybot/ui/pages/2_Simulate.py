@@ -1,24 +1,66 @@
 """Simulation execution page - Prediction Accuracy Only."""
 
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
 import streamlit as st
-from datetime import datetime, timezone
-import pandas as pd
-
-from polybot.brain.models import (
-    Simulation,
-    SimulationMetrics,
-    StrategyConfig,
-    Trade,
-    TradeDirection,
-    TradeResult,
-)
-from polybot.brain.indicators import calculate_indicators
-from polybot.brain.ev_calculator import generate_signal
-from polybot.data.crypto_data import CryptoDataClient
+
+from polybot.brain.models import StrategyConfig, TradeDirection
 from polybot.storage import get_simulation_store
 
+# pandas, numba/pandas-ta (via backtest) and httpx are imported where used, so
+# widget reruns that don't launch a backtest never load them
+if TYPE_CHECKING:
+    import pandas as pd
+
 st.set_page_config(page_title="Backtest - PolyBot", page_icon="🎯", layout="wide")
 
+
+@st.cache_data(ttl=300, max_entries=8, show_spinner=False)
+def _fetch_klines(interval: str, days_back: int) -> pd.DataFrame:
+    from polybot.data.crypto_data import CryptoDataClient
+
+    with CryptoDataClient() as crypto:
+        return crypto.get_historical_klines(
+            symbol="BTCUSDT",
+            interval=interval,
+            days=days_back,
+        )
+
+
+@st.cache_data(ttl=300, max_entries=8, show_spinner=False)
+def _indicators_full(
+    _df: pd.DataFrame, interval: str, last_timestamp, n_rows: int, indicator_configs: list[dict]
+) -> pd.DataFrame:
+    from polybot.brain.indicators import calculate_indicators_full
+
+    # Keyed on the candles' identity instead of hashing the whole DataFrame
+    return calculate_indicators_full(_df, indicator_configs)
+
+
+@st.cache_resource
+def _io_pool() -> ThreadPoolExecutor:
+    # One writer thread shared by all sessions, so saves never overlap
+    return ThreadPoolExecutor(max_workers=1, thread_name_prefix="polybot-save")
+
+
+def _save_in_background(sim_store, simulation, trades_df) -> None:
+    """Persist a simulation off the script thread; 3_Results waits for it."""
+    future = _io_pool().submit(sim_store.save_parquet, simulation, trades_df)
+    st.session_state.setdefault("pending_saves", []).append(future)
+
+
+@lru_cache(maxsize=32)
+def _config_summary(
+    name: str, approach: str, indicator_names: tuple[str, ...]
+) -> tuple[str, str, str]:
+    indicators_str = ", ".join(n.upper() for n in indicator_names) or "Aucun"
+    return name[:25], approach, indicators_str[:20]
+
+
 st.title("🎯 Backtest (Prediction Accuracy)")
 
 st.markdown("""
@@ -38,14 +80,16 @@ config: StrategyConfig = st.session_state.strategy_config
 
 # Show current config summary
 st.markdown("### Configuration Active")
+name_str, approach_str, indicators_str = _config_summary(
+    config.name, config.approach.value, tuple(i.name for i in config.indicators)
+)
 col1, col2, col3 = st.columns(3)
 with col1:
-    st.metric("Stratégie", config.name[:25])
+    st.metric("Stratégie", name_str)
 with col2:
-    st.metric("Approche", config.approach.value)
+    st.metric("Approche", approach_str)
 with col3:
-    indicators_str = ", ".join([i.name.upper() for i in config.indicators]) or "Aucun"
-    st.metric("Indicateurs", indicators_str[:20])
+    st.metric("Indicateurs", indicators_str)
 
 st.divider()
 
@@ -75,6 +119,10 @@ st.divider()
 
 # Run simulation button
 if st.button("🎯 Lancer le Backtest", type="primary", use_container_width=True):
+    import numpy as np
+    import pandas as pd
+
+    from polybot.brain.backtest import build_simulation, run_backtest, window_size_for
 
     progress_bar = st.progress(0, text="Initialisation...")
 
@@ -82,140 +130,55 @@ if st.button("🎯 Lancer le Backtest", type="primary", use_container_width=True
         # Step 1: Fetch BTC data
         progress_bar.progress(10, text="Récupération des données BTC...")
 
-        with CryptoDataClient() as crypto:
-            df = crypto.get_historical_klines(
-                symbol="BTCUSDT",
-                interval=interval,
-                days=days_back,
-            )
+        df = _fetch_klines(interval, days_back)
 
         if df.empty:
+            _fetch_klines.clear()
             st.error("Impossible de récupérer les données BTC. Vérifie ta connexion.")
             st.stop()
 
         st.success(f"{len(df)} bougies récupérées")
 
-        # Step 2: Prepare indicator configs
-        progress_bar.progress(30, text="Calcul des indicateurs...")
-
-        indicator_configs = [ind.model_dump() for ind in config.indicators]
-
-        # Step 3: Simulate predictions
+        # Step 2: Simulate predictions
         progress_bar.progress(40, text="Test des prédictions...")
 
         sim_store = get_simulation_store()
         sim_id = sim_store.generate_id()
 
-        trades: list[Trade] = []
-        trade_count = 0
-
-        # Process data in 15-minute windows
-        window_size = 15 if interval == "1m" else (3 if interval == "5m" else 1)
-
-        for i in range(window_size, len(df), window_size):
-            # Get data up to this point
-            window_df = df.iloc[max(0, i-100):i].copy()
-
-            if len(window_df) < 20:
-                continue
+        def show_progress(fraction: float, n_trades: int) -> None:
+            progress_bar.progress(40 + int(50 * fraction), text=f"Test... {n_trades} prédictions")
 
-            # Calculate indicators
-            signals = calculate_indicators(window_df, indicator_configs)
-
-            # Get current BTC price
-            btc_price = window_df["close"].iloc[-1]
-
-            # Generate signal (market_price doesn't matter for accuracy test)
-            signal = generate_signal(
-                market_id=f"btc-15min-{i}",
-                market_name=f"BTC > ${btc_price:,.0f} dans 15 min?",
-                btc_price=btc_price,
-                market_price=0.50,
-                indicator_signals=signals,
-                config=config,
-                timestamp=window_df["timestamp"].iloc[-1],
-            )
+        full = _indicators_full(
+            df,
+            interval,
+            df["timestamp"].iloc[-1],
+            len(df),
+            [ind.model_dump() for ind in config.indicators],
+        )
+        trades_df = run_backtest(
+            df,
+            config,
+            window_size=window_size_for(interval),
+            on_progress=show_progress,
+            full=full,
+        )
 
-            # If signal says trade, check if prediction was correct
-            if signal.should_trade:
-                if i + window_size < len(df):
-                    future_price = df.iloc[i + window_size - 1]["close"]
-
-                    # Did the price actually go up or down?
-                    price_went_up = future_price > btc_price
-
-                    # Was our prediction correct?
-                    if signal.direction == TradeDirection.UP:
-                        prediction_correct = price_went_up
-                    else:
-                        prediction_correct = not price_went_up
-
-                    result = TradeResult.WIN if prediction_correct else TradeResult.LOSS
-                    trade_count += 1
-
-                    # Record trade (pnl = 1 if correct, 0 if wrong)
-                    trade = Trade(
-                        id=f"{sim_id}-T{trade_count:04d}",
-                        timestamp=signal.timestamp,
-                        simulation_id=sim_id,
-                        market_id=signal.market_id,
-                        market_name=signal.market_name,
-                        direction=signal.direction,
-                        entry_price=0.50,
-                        exit_price=1.0 if prediction_correct else 0.0,
-                        model_probability=signal.model_probability,
-                        expected_value=signal.expected_value,
-                        confidence=signal.confidence,
-                        position_size=1.0,
-                        position_pct=0.0,
-                        result=result,
-                        pnl=1.0 if prediction_correct else 0.0,
-                        pnl_pct=0.0,
-                        indicator_signals=signal.indicator_signals,
-                    )
-                    trades.append(trade)
-
-            # Update progress
-            progress = 40 + int(50 * (i / len(df)))
-            progress_bar.progress(progress, text=f"Test... {len(trades)} prédictions")
-
-        # Step 4: Calculate metrics
+        # Step 3: Calculate metrics
         progress_bar.progress(90, text="Calcul des métriques...")
 
-        correct_predictions = len([t for t in trades if t.result == TradeResult.WIN])
-        total_predictions = len(trades)
-        accuracy = correct_predictions / total_predictions if total_predictions > 0 else 0
-
-        metrics = SimulationMetrics(
-            total_trades=total_predictions,
-            winning_trades=correct_predictions,
-            losing_trades=total_predictions - correct_predictions,
-            win_rate=accuracy,
-            avg_win=1.0,
-            avg_loss=0.0,
-            total_pnl=float(correct_predictions),
-            total_pnl_pct=accuracy,
-            avg_ev_expected=sum(t.expected_value for t in trades) / len(trades) if trades else 0,
-            avg_ev_realized=accuracy - 0.5,
-            max_consecutive_losses=0,
-            max_position_used=0.0,
-        )
-
-        # Step 5: Create and save simulation
-        simulation = Simulation(
-            id=sim_id,
-            created_at=datetime.now(timezone.utc),
-            strategy=config,
+        simulation = build_simulation(
+            sim_id,
+            config,
+            df,
+            trades_df,
             saved_strategy_id=st.session_state.get('saved_strategy_id', None),
-            start_time=df["timestamp"].iloc[0],
-            end_time=df["timestamp"].iloc[-1],
-            initial_capital=0.0,
-            final_capital=float(correct_predictions),
-            trades=trades,
-            metrics=metrics,
         )
+        trades = simulation.trades
+        correct_predictions = simulation.metrics.winning_trades
+        total_predictions = simulation.metrics.total_trades
+        accuracy = simulation.metrics.win_rate
 
-        sim_store.save(simulation)
+        _save_in_background(sim_store, simulation, trades_df)
         progress_bar.progress(100, text="Terminé!")
 
         st.session_state.last_simulation_id = sim_id
@@ -250,23 +213,25 @@ if st.button("🎯 Lancer le Backtest", type="primary", use_container_width=True
         if trades:
             st.markdown("### 📊 Accuracy par Direction")
 
-            up_trades = [t for t in trades if t.direction == TradeDirection.UP]
-            down_trades = [t for t in trades if t.direction == TradeDirection.DOWN]
+            wins = trades_df["win"].to_numpy(dtype=bool)
+            dir_up = (trades_df["direction"] == TradeDirection.UP).to_numpy(dtype=bool)
 
-            up_correct = len([t for t in up_trades if t.result == TradeResult.WIN])
-            down_correct = len([t for t in down_trades if t.result == TradeResult.WIN])
+            up_total = int(dir_up.sum())
+            down_total = total_predictions - up_total
+            up_correct = int((wins & dir_up).sum())
+            down_correct = correct_predictions - up_correct
 
             dcol1, dcol2, dcol3, dcol4 = st.columns(4)
 
             with dcol1:
-                st.metric("Prédictions UP", len(up_trades))
+                st.metric("Prédictions UP", up_total)
             with dcol2:
-                up_acc = up_correct / len(up_trades) * 100 if up_trades else 0
+                up_acc = up_correct / up_total * 100 if up_total else 0
                 st.metric("Accuracy UP", f"{up_acc:.1f}%")
             with dcol3:
-                st.metric("Prédictions DOWN", len(down_trades))
+                st.metric("Prédictions DOWN", down_total)
             with dcol4:
-                down_acc = down_correct / len(down_trades) * 100 if down_trades else 0
+                down_acc = down_correct / down_total * 100 if down_total else 0
                 st.metric("Accuracy DOWN", f"{down_acc:.1f}%")
 
             # Interpretation
@@ -297,16 +262,15 @@ if st.button("🎯 Lancer le Backtest", type="primary", use_container_width=True
         if trades:
             st.markdown("### 📝 Dernières Prédictions")
 
-            trade_data = []
-            for t in trades[-15:]:
-                trade_data.append({
-                    "Date": t.timestamp.strftime("%Y-%m-%d %H:%M"),
-                    "Prédiction": "📈 UP" if t.direction == TradeDirection.UP else "📉 DOWN",
-                    "EV Attendue": f"{t.expected_value*100:.1f}%",
-                    "Résultat": "✅ Correct" if t.result == TradeResult.WIN else "❌ Faux",
-                })
+            tail = trades_df.tail(15)
+            trade_data = pd.DataFrame({
+                "Date": tail["timestamp"].dt.strftime("%Y-%m-%d %H:%M"),
+                "Prédiction": np.where(tail["direction"] == TradeDirection.UP, "📈 UP", "📉 DOWN"),
+                "EV Attendue": (tail["expected_value"] * 100).map("{:.1f}%".format),
+                "Résultat": np.where(tail["win"], "✅ Correct", "❌ Faux"),
+            })
 
-            st.dataframe(pd.DataFrame(trade_data), use_container_width=True, hide_index=True)
+            st.dataframe(trade_data, use_container_width=True, hide_index=True)
 
         st.divider()
 
@@ -319,3 +283,49 @@ if st.button("🎯 Lancer le Backtest", type="primary", use_container_width=True
     except Exception as e:
         st.error(f"Erreur pendant le backtest: {str(e)}")
         raise e
+
+# Interval comparison
+st.divider()
+
+with st.expander("⚡ Comparer les intervalles (1m / 5m / 15m)", expanded=False):
+    st.markdown(
+        "Lance le backtest sur les 3 intervalles en parallèle pour voir "
+        "lequel donne la meilleure accuracy avec ta stratégie."
+    )
+
+    if st.button("Lancer la comparaison", use_container_width=True):
+        import pandas as pd
+
+        from polybot.brain.backtest import build_simulation, run_backtests_parallel
+
+        with st.spinner("Backtests en cours..."):
+            candles = {iv: _fetch_klines(iv, days_back) for iv in ("1m", "5m", "15m")}
+            candles = {iv: df for iv, df in candles.items() if not df.empty}
+
+            if not candles:
+                _fetch_klines.clear()
+                st.error("Impossible de récupérer les données BTC. Vérifie ta connexion.")
+                st.stop()
+
+            results = run_backtests_parallel(config, candles)
+
+            # Saved once all runs are done, from the script thread
+            sim_store = get_simulation_store()
+            comparison = []
+            for iv in candles:
+                simulation = build_simulation(
+                    sim_store.generate_id(),
+                    config,
+                    candles[iv],
+                    results[iv],
+                    saved_strategy_id=st.session_state.get('saved_strategy_id', None),
+                )
+                _save_in_background(sim_store, simulation, results[iv])
+                comparison.append({
+                    "Intervalle": iv,
+                    "Prédictions": simulation.metrics.total_trades,
+                    "Accuracy": f"{simulation.metrics.win_rate * 100:.1f}%",
+                    "ID": simulation.id,
+                })
+
+        st.dataframe(pd.DataFrame(comparison), use_container_width=True, hide_index=True)
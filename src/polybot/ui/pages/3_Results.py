@@ -1,13 +1,15 @@
 """Results analysis page - Prediction Accuracy focus."""
 
+from functools import partial
+
 import streamlit as st
+import numpy as np
 import pandas as pd
-import plotly.express as px
 import plotly.graph_objects as go
 
 from polybot.brain.models import TradeDirection, TradeResult
 from polybot.storage import get_simulation_store, get_insight_store
-from polybot.tutor.explainer import SimulationExplainer
+from polybot.ui.components.charts import lttb_indices
 
 st.set_page_config(page_title="Résultats - PolyBot", page_icon="📊", layout="wide")
 
@@ -16,7 +18,20 @@ st.title("📊 Analyse des Résultats")
 # Load simulations
 sim_store = get_simulation_store()
 insight_store = get_insight_store()
-explainer = SimulationExplainer()
+
+# Wait for saves started by the Backtest page; slow ones stay queued for
+# the next rerun instead of being dropped
+still_pending = []
+for future in st.session_state.pop("pending_saves", []):
+    try:
+        future.result(timeout=30)
+    except TimeoutError:
+        still_pending.append(future)
+    except Exception as e:
+        st.error(f"Erreur lors de la sauvegarde d'une simulation: {str(e)}")
+if still_pending:
+    st.session_state.pending_saves = still_pending
+    st.warning("Sauvegarde en cours... la simulation apparaîtra au prochain rafraîchissement.")
 
 # Get simulation list
 simulations = sim_store.list_all()
@@ -29,31 +44,34 @@ if not simulations:
 # Simulation selector
 st.markdown("### Sélectionne une Simulation")
 
+# Format options to show accuracy instead of P&L; simulation id -> label
+sim_labels = {}
 default_index = 0
-if "last_simulation_id" in st.session_state:
-    for i, sim in enumerate(simulations):
-        if sim["id"] == st.session_state.last_simulation_id:
-            default_index = i
-            break
-
-# Format options to show accuracy instead of P&L
-sim_options = []
-for s in simulations:
+last_simulation_id = st.session_state.get("last_simulation_id")
+for i, s in enumerate(simulations):
     win_rate = s.get('win_rate', s.get('pnl_pct', 0))
     if isinstance(win_rate, (int, float)):
         win_rate_pct = win_rate * 100 if win_rate <= 1 else win_rate
     else:
         win_rate_pct = 50.0
-    sim_options.append(f"{s['id']} | {s['strategy_name']} | Accuracy: {win_rate_pct:.1f}%")
+    sim_labels[s["id"]] = f"{s['id']} | {s['strategy_name']} | Accuracy: {win_rate_pct:.1f}%"
+    if s["id"] == last_simulation_id:
+        default_index = i
 
-selected_sim_str = st.selectbox(
+selected_sim_id = st.selectbox(
     "Simulation:",
-    sim_options,
+    list(sim_labels),
     index=default_index,
+    format_func=sim_labels.get,
 )
 
-selected_sim_id = simulations[sim_options.index(selected_sim_str)]["id"]
-simulation = sim_store.load(selected_sim_id)
+# Keep the loaded simulation across reruns; this page's own edits
+# (AI explanation) are made on the same object before saving
+simulation = st.session_state.get("results_simulation")
+if simulation is None or simulation.id != selected_sim_id:
+    simulation = sim_store.load(selected_sim_id)
+    st.session_state.results_simulation = simulation
+    st.session_state.results_trades = None
 
 if not simulation:
     st.error("Simulation introuvable")
@@ -99,27 +117,35 @@ st.markdown("### 📉 Visualisations")
 
 tab1, tab2, tab3 = st.tabs(["Accuracy Cumulative", "Distribution", "Détail Prédictions"])
 
+# One row per trade, shared by the three tabs; built once per selected simulation
+trades = st.session_state.get("results_trades")
+if trades is None:
+    trades = pd.DataFrame.from_records(
+        [
+            (t.timestamp, t.direction == TradeDirection.UP, t.model_probability,
+             t.expected_value, t.confidence, t.result == TradeResult.WIN)
+            for t in simulation.trades
+        ],
+        columns=["timestamp", "up", "model_probability", "expected_value", "confidence", "win"],
+    )
+    st.session_state.results_trades = trades
+
 with tab1:
     # Cumulative accuracy over time
     if simulation.trades:
-        correct_count = 0
-        total_count = 0
-        accuracy_history = []
-        timestamps = []
-
-        for trade in simulation.trades:
-            total_count += 1
-            if trade.result == TradeResult.WIN:
-                correct_count += 1
-            accuracy_history.append(correct_count / total_count * 100)
-            timestamps.append(trade.timestamp)
+        win = trades["win"].to_numpy(dtype=bool)
+        accuracy_history = np.cumsum(win) / np.arange(1, len(win) + 1) * 100
+        timestamps = pd.to_datetime(trades["timestamp"])
+
+        # Long runs: plot an LTTB subset, which keeps the curve's shape
+        kept = lttb_indices(timestamps.to_numpy(dtype=np.int64), accuracy_history)
 
         fig = go.Figure()
 
         # Accuracy line
-        fig.add_trace(go.Scatter(
-            x=timestamps,
-            y=accuracy_history,
+        fig.add_trace(go.Scattergl(
+            x=timestamps.iloc[kept],
+            y=accuracy_history[kept],
             mode='lines',
             name='Accuracy Cumulative',
             line=dict(color='blue', width=2),
@@ -144,7 +170,7 @@ with tab1:
         st.plotly_chart(fig, use_container_width=True)
 
         # Interpretation
-        final_accuracy = accuracy_history[-1] if accuracy_history else 50
+        final_accuracy = accuracy_history[-1] if len(accuracy_history) else 50
         if final_accuracy > 55:
             st.success(f"Ton accuracy finale de {final_accuracy:.1f}% est supérieure au hasard!")
         elif final_accuracy > 48:
@@ -160,140 +186,145 @@ with tab2:
 
         with col1:
             # Correct/Wrong distribution
-            result_data = {
-                "Résultat": ["Correct", "Faux"],
-                "Nombre": [correct, wrong],
-            }
-            fig = px.pie(
-                result_data,
-                values="Nombre",
-                names="Résultat",
-                color="Résultat",
-                color_discrete_map={"Correct": "green", "Faux": "red"},
-                title="Répartition Correct/Faux",
-            )
+            fig = go.Figure(go.Pie(
+                labels=["Correct", "Faux"],
+                values=[correct, wrong],
+                marker_colors=["green", "red"],
+            ))
+            fig.update_layout(title="Répartition Correct/Faux")
             st.plotly_chart(fig, use_container_width=True)
 
         with col2:
             # Direction distribution
-            up_trades = [t for t in simulation.trades if t.direction == TradeDirection.UP]
-            down_trades = [t for t in simulation.trades if t.direction == TradeDirection.DOWN]
-
-            dir_data = {
-                "Direction": ["UP", "DOWN"],
-                "Nombre": [len(up_trades), len(down_trades)],
-            }
-            fig = px.pie(
-                dir_data,
-                values="Nombre",
-                names="Direction",
-                color="Direction",
-                color_discrete_map={"UP": "blue", "DOWN": "orange"},
-                title="Répartition des Prédictions",
-            )
+            up = trades["up"].to_numpy(dtype=bool)
+            up_total = int(up.sum())
+            down_total = len(up) - up_total
+
+            fig = go.Figure(go.Pie(
+                labels=["UP", "DOWN"],
+                values=[up_total, down_total],
+                marker_colors=["blue", "orange"],
+            ))
+            fig.update_layout(title="Répartition des Prédictions")
             st.plotly_chart(fig, use_container_width=True)
 
         # Accuracy by direction
         st.markdown("#### Accuracy par Direction")
 
-        up_correct = len([t for t in up_trades if t.result == TradeResult.WIN])
-        down_correct = len([t for t in down_trades if t.result == TradeResult.WIN])
-
-        up_acc = up_correct / len(up_trades) * 100 if up_trades else 0
-        down_acc = down_correct / len(down_trades) * 100 if down_trades else 0
-
-        dir_acc_data = {
-            "Direction": ["UP", "DOWN"],
-            "Accuracy (%)": [up_acc, down_acc],
-            "Correct": [up_correct, down_correct],
-            "Total": [len(up_trades), len(down_trades)],
-        }
-
-        fig = px.bar(
-            dir_acc_data,
-            x="Direction",
-            y="Accuracy (%)",
-            color="Direction",
-            color_discrete_map={"UP": "blue", "DOWN": "orange"},
+        win = trades["win"].to_numpy(dtype=bool)
+        up_correct = int((win & up).sum())
+        down_correct = int(win.sum()) - up_correct
+
+        up_acc = up_correct / up_total * 100 if up_total else 0
+        down_acc = down_correct / down_total * 100 if down_total else 0
+
+        fig = go.Figure(go.Bar(
+            x=["UP", "DOWN"],
+            y=[up_acc, down_acc],
+            marker_color=["blue", "orange"],
+            text=[f"{up_acc:.1f}%", f"{down_acc:.1f}%"],
+            textposition='outside',
+        ))
+        fig.update_layout(
             title="Accuracy par Direction",
-            text="Accuracy (%)",
+            xaxis_title="Direction",
+            yaxis_title="Accuracy (%)",
         )
         fig.add_hline(y=50, line_dash="dash", line_color="gray", annotation_text="Random")
-        fig.update_traces(texttemplate='%{text:.1f}%', textposition='outside')
         st.plotly_chart(fig, use_container_width=True)
 
 with tab3:
     if simulation.trades:
-        trade_data = []
-        for t in simulation.trades:
-            trade_data.append({
-                "Date": t.timestamp.strftime("%Y-%m-%d %H:%M"),
-                "Prédiction": "UP" if t.direction == TradeDirection.UP else "DOWN",
-                "Probabilité Modèle": f"{t.model_probability*100:.1f}%",
-                "EV Attendue": f"{t.expected_value*100:+.1f}%",
-                "Confiance": f"{t.confidence*100:.0f}%",
-                "Résultat": "Correct" if t.result == TradeResult.WIN else "Faux",
-            })
-
-        df = pd.DataFrame(trade_data)
+        df = pd.DataFrame({
+            "Date": pd.to_datetime(trades["timestamp"]).dt.strftime("%Y-%m-%d %H:%M"),
+            "Prédiction": np.where(trades["up"], "UP", "DOWN"),
+            "Probabilité Modèle": (trades["model_probability"] * 100).map("{:.1f}%".format),
+            "EV Attendue": (trades["expected_value"] * 100).map("{:+.1f}%".format),
+            "Confiance": (trades["confidence"] * 100).map("{:.0f}%".format),
+            "Résultat": np.where(trades["win"], "Correct", "Faux"),
+        })
         st.dataframe(df, use_container_width=True, hide_index=True)
 
-        # Download button
-        csv = df.to_csv(index=False)
+        # Download button; the CSV is only serialised when it is clicked
+        # (callable data needs Streamlit >= 1.52, the project floor is 1.53)
         st.download_button(
             "Télécharger CSV",
-            csv,
+            partial(df.to_csv, index=False),
             f"predictions_{simulation.id}.csv",
             "text/csv",
+            on_click="ignore",
         )
 
 st.divider()
 
-# AI Explanation
-st.markdown("### 🤖 Analyse IA")
+# AI Explanation and insights run as fragments: their buttons only rerun
+# their own section, not the charts above
+
+
+@st.fragment
+def ai_explanation_section():
+    st.markdown("### 🤖 Analyse IA")
 
-has_valid_explanation = simulation.ai_explanation and "API Claude n'est pas configurée" not in simulation.ai_explanation
+    has_valid_explanation = (
+        simulation.ai_explanation
+        and "API Claude n'est pas configurée" not in simulation.ai_explanation
+    )
 
-if has_valid_explanation:
-    st.markdown(simulation.ai_explanation)
-    if st.button("Régénérer l'analyse", type="secondary"):
-        st.rerun()
-else:
-    if st.button("Générer l'Analyse IA", type="primary"):
-        with st.spinner("L'IA analyse tes résultats..."):
+    if has_valid_explanation:
+        st.markdown(simulation.ai_explanation)
+        if st.button("Régénérer l'analyse", type="secondary"):
+            st.rerun()
+    else:
+        if st.button("Générer l'Analyse IA", type="primary"):
+            with st.spinner("L'IA analyse tes résultats..."):
+                try:
+                    # Imported on click: keeps the Anthropic SDK off the first render
+                    from polybot.tutor.explainer import SimulationExplainer
+
+                    explanation = SimulationExplainer().explain_simulation(simulation)
+                    if "API Claude n'est pas configurée" not in explanation:
+                        simulation.ai_explanation = explanation
+                        sim_store.save(simulation)
+                    st.markdown(explanation)
+                except Exception as e:
+                    st.error(f"Erreur lors de l'analyse: {str(e)}")
+                    st.info(
+                        "Configure ta clé API Anthropic dans .env "
+                        "pour activer les explications IA."
+                    )
+
+
+@st.fragment
+def insights_section():
+    st.markdown("### 💡 Extraction d'Insights")
+
+    if st.button("Extraire des Insights"):
+        with st.spinner("Recherche de patterns..."):
             try:
-                explanation = explainer.explain_simulation(simulation)
-                if "API Claude n'est pas configurée" not in explanation:
-                    simulation.ai_explanation = explanation
-                    sim_store.save(simulation)
-                st.markdown(explanation)
+                from polybot.tutor.explainer import SimulationExplainer
+
+                new_insights = SimulationExplainer().generate_insights(simulation, insight_store)
+                if new_insights:
+                    st.success(f"{len(new_insights)} nouveaux insights découverts!")
+                    for insight in new_insights:
+                        with st.expander(f"💡 {insight.title}"):
+                            st.markdown(f"**Catégorie:** {insight.category}")
+                            st.markdown(insight.description)
+                            if insight.suggested_experiments:
+                                st.markdown("**Expériences suggérées:**")
+                                for exp in insight.suggested_experiments:
+                                    st.markdown(f"- {exp}")
+                else:
+                    st.info("Pas de nouveaux insights pour cette simulation.")
             except Exception as e:
-                st.error(f"Erreur lors de l'analyse: {str(e)}")
-                st.info("Configure ta clé API Anthropic dans .env pour activer les explications IA.")
+                st.error(f"Erreur: {str(e)}")
+                st.info("Configure ta clé API Anthropic pour activer l'extraction d'insights.")
+
+
+ai_explanation_section()
 
-# Insights generation
 st.divider()
-st.markdown("### 💡 Extraction d'Insights")
-
-if st.button("Extraire des Insights"):
-    with st.spinner("Recherche de patterns..."):
-        try:
-            new_insights = explainer.generate_insights(simulation, insight_store)
-            if new_insights:
-                st.success(f"{len(new_insights)} nouveaux insights découverts!")
-                for insight in new_insights:
-                    with st.expander(f"💡 {insight.title}"):
-                        st.markdown(f"**Catégorie:** {insight.category}")
-                        st.markdown(insight.description)
-                        if insight.suggested_experiments:
-                            st.markdown("**Expériences suggérées:**")
-                            for exp in insight.suggested_experiments:
-                                st.markdown(f"- {exp}")
-            else:
-                st.info("Pas de nouveaux insights pour cette simulation.")
-        except Exception as e:
-            st.error(f"Erreur: {str(e)}")
-            st.info("Configure ta clé API Anthropic pour activer l'extraction d'insights.")
+insights_section()
 
 st.divider()
 st.markdown("### 🔬 Prochaines Étapes")
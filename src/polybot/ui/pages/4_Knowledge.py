@@ -44,7 +44,10 @@ st.divider()
 # Tabs
 tab1, tab2, tab3 = st.tabs(["💡 Insights", "🔬 Expériences", "📊 Simulations"])
 
-with tab1:
+
+# The insight filters only rerun this fragment, not the whole page
+@st.fragment
+def insights_tab():
     st.markdown("### 💡 Insights Découverts")
 
     # Filters
@@ -90,6 +93,10 @@ with tab1:
 
                 st.markdown(f"**Basé sur:** {len(insight.evidence_simulation_ids)} simulation(s)")
 
+
+with tab1:
+    insights_tab()
+
 with tab2:
     st.markdown("### 🔬 Expériences à Tester")
 
@@ -98,9 +105,13 @@ with tab2:
     if not experiments:
         st.info("📭 Aucune expérience suggérée. Les insights génèrent des expériences automatiquement.")
     else:
-        # Group by status
-        pending = [e for e in experiments if e.status == "pending"]
-        completed = [e for e in experiments if e.status == "completed"]
+        # Group by status in one pass (running experiments are not listed)
+        pending, completed = [], []
+        for e in experiments:
+            if e.status == "pending":
+                pending.append(e)
+            elif e.status == "completed":
+                completed.append(e)
 
         if pending:
             st.markdown("#### En Attente")
@@ -168,7 +179,9 @@ with tab3:
         st.divider()
         st.markdown("#### Statistiques Globales")
 
-        total_pnl = sum(s["pnl"] for s in simulations)
+        # P&L totals come with the store stats loaded above
+        total_pnl = sim_stats["total_pnl"]
+        profitable = sim_stats["winning_simulations"]
         avg_win_rate = sum(s["win_rate"] for s in simulations) / len(simulations)
 
         col1, col2, col3 = st.columns(3)
@@ -180,7 +193,6 @@ with tab3:
             st.metric("Win Rate Moyen", f"{avg_win_rate*100:.1f}%")
 
         with col3:
-            profitable = len([s for s in simulations if s["pnl"] > 0])
             st.metric("Simulations Rentables", f"{profitable}/{len(simulations)}")
 
 st.divider()
@@ -70,27 +70,18 @@ st.divider()
 # Full leaderboard table
 st.markdown("### 📊 Classement Complet")
 
-df = pd.DataFrame(leaderboard)
-df = df.rename(columns={
-    "rank": "Rang",
-    "name": "Stratégie",
-    "author": "Auteur",
-    "approach": "Approche",
-    "simulations": "Simulations",
-    "avg_pnl_pct": "P&L Moyen (%)",
-    "best_pnl_pct": "Meilleur P&L (%)",
-    "total_trades": "Trades Total",
-    "win_rate": "Win Rate",
+# Displayed columns, already formatted
+df = pd.DataFrame({
+    "Rang": [s["rank"] for s in leaderboard],
+    "Stratégie": [s["name"] for s in leaderboard],
+    "Auteur": [s["author"] for s in leaderboard],
+    "Approche": [s["approach"] for s in leaderboard],
+    "Simulations": [s["simulations"] for s in leaderboard],
+    "P&L Moyen (%)": [f"{s['avg_pnl_pct']:+.2f}%" for s in leaderboard],
+    "Meilleur P&L (%)": [f"{s['best_pnl_pct']:+.2f}%" for s in leaderboard],
+    "Win Rate": [f"{s['win_rate']*100:.1f}%" for s in leaderboard],
 })
-
-# Format columns
-df["P&L Moyen (%)"] = df["P&L Moyen (%)"].apply(lambda x: f"{x:+.2f}%")
-df["Meilleur P&L (%)"] = df["Meilleur P&L (%)"].apply(lambda x: f"{x:+.2f}%")
-df["Win Rate"] = df["Win Rate"].apply(lambda x: f"{x*100:.1f}%")
-
-# Select columns to display
-display_cols = ["Rang", "Stratégie", "Auteur", "Approche", "Simulations", "P&L Moyen (%)", "Meilleur P&L (%)", "Win Rate"]
-st.dataframe(df[display_cols], use_container_width=True, hide_index=True)
+st.dataframe(df, use_container_width=True, hide_index=True)
 
 st.divider()
 
@@ -117,14 +108,11 @@ if selected_name:
 
         with col2:
             st.markdown("**Paramètres avancés:**")
-            sizing = getattr(strategy.config, 'position_sizing', None)
-            st.write(f"- Position Sizing: {sizing.value if sizing else 'Kelly'}")
-            fee = getattr(strategy.config, 'fee_pct', 0.01) * 100
-            st.write(f"- Frais/Slippage: {fee:.1f}%")
-            tp_enabled = getattr(strategy.config, 'take_profit_enabled', False)
-            if tp_enabled:
-                tp_pct = getattr(strategy.config, 'take_profit_pct', 0.9) * 100
-                st.write(f"- Take Profit: {tp_pct:.0f}%")
+            config = strategy.config
+            st.write(f"- Position Sizing: {config.position_sizing.value}")
+            st.write(f"- Frais/Slippage: {config.fee_pct * 100:.1f}%")
+            if config.take_profit_enabled:
+                st.write(f"- Take Profit: {config.take_profit_pct * 100:.0f}%")
             else:
                 st.write("- Take Profit: Désactivé")
 
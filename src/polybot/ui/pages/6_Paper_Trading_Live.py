@@ -1,6 +1,7 @@
 """Paper Trading with Real Polymarket Odds."""
 
 import streamlit as st
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 import time
 import pandas as pd
@@ -23,6 +24,117 @@ st.set_page_config(
     layout="wide"
 )
 
+
+# 1m candles fetched and fed to the indicators for the live signal
+LIVE_CANDLES = 100
+
+
+# One client per server process, so their connection pools outlive reruns;
+# on_release (Streamlit >= 1.53) closes them when the cache is cleared
+@st.cache_resource(on_release=CryptoDataClient.close)
+def _crypto_client() -> CryptoDataClient:
+    return CryptoDataClient()
+
+
+@st.cache_resource(on_release=PolymarketClient.close)
+def _polymarket_client() -> PolymarketClient:
+    return PolymarketClient()
+
+
+# Live data, shared across reruns and sessions until it goes stale
+@st.cache_data(ttl=30, max_entries=1, show_spinner=False)
+def _fetch_btc_price() -> float:
+    return _crypto_client().get_current_price()
+
+
+@st.cache_data(ttl=60, max_entries=1, show_spinner=False)
+def _fetch_recent_klines() -> pd.DataFrame:
+    return _crypto_client().get_recent_klines(
+        symbol="BTCUSDT",
+        interval="1m",
+        limit=LIVE_CANDLES,
+    )
+
+
+@st.cache_data(ttl=10, max_entries=1, show_spinner=False)
+def _fetch_btc_market() -> dict | None:
+    return _polymarket_client().get_current_btc_market()
+
+
+@st.cache_data(ttl=60, max_entries=16, show_spinner=False)
+def _indicator_signals(_df: pd.DataFrame, last_timestamp, indicator_configs: list[dict]) -> list:
+    # Keyed on the last candle instead of hashing the whole DataFrame
+    return calculate_indicators(_df.iloc[-LIVE_CANDLES:], indicator_configs)
+
+
+# Only this form reruns while the stake is edited; executing a trade reruns the page
+@st.fragment
+def trade_form(
+    signal,
+    direction_str: str,
+    up_price: float,
+    down_price: float,
+    market_id: str,
+    market_question: str,
+    btc_price: float,
+    active_session: PaperTradingSession,
+):
+    col1, col2, col3 = st.columns(3)
+
+    with col1:
+        stake = st.number_input(
+            "Mise ($)",
+            min_value=10.0,
+            max_value=1000.0,
+            value=100.0,
+            step=10.0,
+            help="Combien tu veux miser sur ce trade"
+        )
+
+    with col2:
+        # Entry price based on direction
+        if signal.direction == TradeDirection.UP:
+            entry_odds = up_price
+            st.markdown(f"**Acheter UP à:** {entry_odds*100:.1f}%")
+        else:
+            entry_odds = down_price
+            st.markdown(f"**Acheter DOWN à:** {entry_odds*100:.1f}%")
+
+    with col3:
+        # Calculate potential P&L
+        potential_win = stake * (1 - entry_odds) / entry_odds
+        st.markdown(f"""
+        **Si correct:** +${potential_win:.2f}
+        **Si faux:** -${stake:.2f}
+        """)
+
+    if st.button(f"🎰 Exécuter {direction_str}", type="primary", use_container_width=True):
+        position = PaperPosition(
+            id=paper_store.generate_position_id(),
+            session_id=active_session.id,
+            created_at=datetime.now(timezone.utc),
+            market_id=market_id,
+            market_question=market_question,
+            direction=signal.direction,
+            entry_odds=entry_odds,
+            entry_btc_price=btc_price,
+            stake=stake,
+            model_probability=signal.model_probability,
+            expected_value=signal.expected_value,
+            confidence=signal.confidence,
+            indicator_signals=signal.indicator_signals,
+            status="open",
+        )
+
+        active_session.positions.append(position)
+        active_session.total_positions += 1
+        paper_store.save(active_session)
+
+        # A toast survives the rerun, so there's no need to pause the script
+        st.toast(f"Position ouverte: {direction_str} à {entry_odds*100:.1f}%", icon="✅")
+        st.rerun()
+
+
 st.title("💰 Paper Trading Live")
 st.markdown("""
 **Trade avec les VRAIS odds Polymarket** - Simule exactement ce que tu gagnerais/perdrais en réel.
@@ -47,6 +159,15 @@ col1, col2, col3 = st.columns(3)
 # Check for active session
 active_session = paper_store.get_active_session()
 
+# Split positions by status once for the header, open list and history
+open_positions, resolved = [], []
+if active_session:
+    for p in active_session.positions:
+        if p.status == "open":
+            open_positions.append(p)
+        elif p.status == "resolved":
+            resolved.append(p)
+
 with col1:
     if active_session:
         st.success(f"Session active")
@@ -67,8 +188,7 @@ with col1:
 
 with col2:
     if active_session:
-        open_count = len([p for p in active_session.positions if p.status == "open"])
-        st.metric("Positions Ouvertes", open_count)
+        st.metric("Positions Ouvertes", len(open_positions))
 
 with col3:
     if active_session:
@@ -82,26 +202,25 @@ if active_session:
     # Fetch live data
     st.markdown("## 📊 Marché Polymarket en Direct")
 
-    with st.spinner("Connexion à Polymarket..."):
+    # The three fetches are independent: run them side by side
+    with st.spinner("Connexion à Polymarket..."), ThreadPoolExecutor(max_workers=3) as pool:
+        price_future = pool.submit(_fetch_btc_price)
+        klines_future = pool.submit(_fetch_recent_klines)
+        market_future = pool.submit(_fetch_btc_market)
+
         try:
             # Get BTC price
-            with CryptoDataClient() as crypto:
-                btc_price = crypto.get_current_price()
-                df = crypto.get_historical_klines(
-                    symbol="BTCUSDT",
-                    interval="1m",
-                    days=1,
-                )
+            btc_price = price_future.result()
+            df = klines_future.result()
 
             # Get real Polymarket market
             market = None
             polymarket_available = False
 
             try:
-                with PolymarketClient() as poly:
-                    market = poly.get_current_btc_market()
-                    if market:
-                        polymarket_available = True
+                market = market_future.result()
+                if market:
+                    polymarket_available = True
             except Exception as e:
                 st.error(f"Erreur Polymarket: {e}")
 
@@ -186,7 +305,7 @@ if active_session:
 
     if len(df) >= 20:
         indicator_configs = [ind.model_dump() for ind in config.indicators]
-        signals = calculate_indicators(df.iloc[-100:], indicator_configs)
+        signals = _indicator_signals(df, df["timestamp"].iloc[-1], indicator_configs)
 
         signal = generate_signal(
             market_id=market_id,
@@ -229,61 +348,16 @@ if active_session:
         if signal.should_trade:
             st.success(f"**Signal actif: {direction_str}** avec EV de {ev_delta:+.1f}%")
 
-            col1, col2, col3 = st.columns(3)
-
-            with col1:
-                stake = st.number_input(
-                    "Mise ($)",
-                    min_value=10.0,
-                    max_value=1000.0,
-                    value=100.0,
-                    step=10.0,
-                    help="Combien tu veux miser sur ce trade"
-                )
-
-            with col2:
-                # Entry price based on direction
-                if signal.direction == TradeDirection.UP:
-                    entry_odds = up_price
-                    st.markdown(f"**Acheter UP à:** {entry_odds*100:.1f}%")
-                else:
-                    entry_odds = down_price
-                    st.markdown(f"**Acheter DOWN à:** {entry_odds*100:.1f}%")
-
-            with col3:
-                # Calculate potential P&L
-                potential_win = stake * (1 - entry_odds) / entry_odds
-                st.markdown(f"""
-                **Si correct:** +${potential_win:.2f}
-                **Si faux:** -${stake:.2f}
-                """)
-
-            if st.button(f"🎰 Exécuter {direction_str}", type="primary", use_container_width=True):
-                position = PaperPosition(
-                    id=paper_store.generate_position_id(),
-                    session_id=active_session.id,
-                    created_at=datetime.now(timezone.utc),
-                    market_id=market_id,
-                    market_question=market_question,
-                    direction=signal.direction,
-                    entry_odds=entry_odds,
-                    entry_btc_price=btc_price,
-                    stake=stake,
-                    model_probability=signal.model_probability,
-                    expected_value=signal.expected_value,
-                    confidence=signal.confidence,
-                    indicator_signals=signal.indicator_signals,
-                    status="open",
-                )
-
-                active_session.positions.append(position)
-                active_session.total_positions += 1
-                paper_store.save(active_session)
-
-                st.success(f"Position ouverte: {direction_str} à {entry_odds*100:.1f}%")
-                st.balloons()
-                time.sleep(1)
-                st.rerun()
+            trade_form(
+                signal,
+                direction_str,
+                up_price,
+                down_price,
+                market_id,
+                market_question,
+                btc_price,
+                active_session,
+            )
         else:
             st.warning("Pas de signal de trade - conditions non remplies")
             st.write(f"Raison: {signal.reasoning_summary}")
@@ -296,19 +370,17 @@ if active_session:
     # Open positions
     st.markdown("## 📂 Positions Ouvertes")
 
-    open_positions = [p for p in active_session.positions if p.status == "open"]
-
     if open_positions:
         for pos in open_positions:
             direction_str = "UP 📈" if pos.direction == TradeDirection.UP else "DOWN 📉"
-            potential_win = pos.stake * (1 - pos.entry_odds) / pos.entry_odds
 
             with st.container():
                 st.markdown(f"""
                 ### {direction_str} @ {pos.entry_odds*100:.1f}%
                 - **Mise:** ${pos.stake:.2f}
                 - **BTC à l'entrée:** ${pos.entry_btc_price:,.2f}
-                - **Gain potentiel:** +${potential_win:.2f} | **Perte potentielle:** -${pos.stake:.2f}
+                - **Gain potentiel:** +${pos.potential_win:.2f}
+                - **Perte potentielle:** -${pos.stake:.2f}
                 """)
 
                 st.markdown("**Comment le marché s'est-il résolu?**")
@@ -322,7 +394,7 @@ if active_session:
                         pos.status = "resolved"
 
                         if pos.direction == TradeDirection.UP:
-                            pos.realized_pnl = pos.stake * (1 - pos.entry_odds) / pos.entry_odds
+                            pos.realized_pnl = pos.potential_win
                         else:
                             pos.realized_pnl = -pos.stake
 
@@ -342,7 +414,7 @@ if active_session:
                         pos.status = "resolved"
 
                         if pos.direction == TradeDirection.DOWN:
-                            pos.realized_pnl = pos.stake * (1 - pos.entry_odds) / pos.entry_odds
+                            pos.realized_pnl = pos.potential_win
                         else:
                             pos.realized_pnl = -pos.stake
 
@@ -362,24 +434,22 @@ if active_session:
     # Position history
     st.markdown("## 📜 Historique des Positions")
 
-    resolved = [p for p in active_session.positions if p.status == "resolved"]
-
     if resolved:
-        history_data = []
-        for pos in reversed(resolved):
-            direction_str = "UP" if pos.direction == TradeDirection.UP else "DOWN"
-            result_emoji = "✅" if pos.realized_pnl and pos.realized_pnl > 0 else "❌"
-            history_data.append({
-                "Heure": pos.resolved_at.strftime("%H:%M:%S") if pos.resolved_at else "-",
-                "Direction": direction_str,
-                "Odds Entrée": f"{pos.entry_odds*100:.1f}%",
-                "Résolution": pos.resolution,
-                "Mise": f"${pos.stake:.2f}",
-                "P&L": f"${pos.realized_pnl:+.2f}" if pos.realized_pnl else "-",
-                "Résultat": result_emoji,
-            })
-
-        st.dataframe(pd.DataFrame(history_data), use_container_width=True, hide_index=True)
+        # Most recent first, built column by column
+        history = resolved[::-1]
+        history_df = pd.DataFrame({
+            "Heure": [
+                p.resolved_at.strftime("%H:%M:%S") if p.resolved_at else "-" for p in history
+            ],
+            "Direction": ["UP" if p.direction == TradeDirection.UP else "DOWN" for p in history],
+            "Odds Entrée": [f"{p.entry_odds*100:.1f}%" for p in history],
+            "Résolution": [p.resolution for p in history],
+            "Mise": [f"${p.stake:.2f}" for p in history],
+            "P&L": [f"${p.realized_pnl:+.2f}" if p.realized_pnl else "-" for p in history],
+            "Résultat": ["✅" if p.realized_pnl and p.realized_pnl > 0 else "❌" for p in history],
+        })
+
+        st.dataframe(history_df, use_container_width=True, hide_index=True)
 
         # Session summary
         st.markdown("### Résumé de la Session")
@@ -388,18 +458,17 @@ if active_session:
         with col1:
             st.metric("Positions Résolues", len(resolved))
 
+        # Wins and P&L are kept on the session as positions are resolved
         with col2:
-            wins = len([p for p in resolved if p.realized_pnl and p.realized_pnl > 0])
-            wr = wins / len(resolved) * 100 if resolved else 0
+            wr = active_session.winning_positions / len(resolved) * 100
             st.metric("Win Rate", f"{wr:.1f}%")
 
         with col3:
-            total_pnl = sum(p.realized_pnl for p in resolved if p.realized_pnl)
-            color = "normal" if total_pnl >= 0 else "inverse"
+            total_pnl = active_session.total_pnl
             st.metric("P&L Session", f"${total_pnl:+.2f}")
 
         with col4:
-            avg_pnl = total_pnl / len(resolved) if resolved else 0
+            avg_pnl = total_pnl / len(resolved)
             st.metric("P&L Moyen", f"${avg_pnl:+.2f}")
     else:
         st.info("Aucune position résolue encore")
@@ -0,0 +1,48 @@
+"""Fixtures shared across test modules."""
+
+from collections.abc import Callable
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from polybot.brain.models import IndicatorConfig, StrategyApproach, StrategyConfig
+
+
+def _create_candles(n: int = 600) -> pd.DataFrame:
+    """Create a random-walk BTC-like OHLCV DataFrame."""
+    np.random.seed(42)
+    close = 60000 + np.cumsum(np.random.randn(n) * 40)
+
+    return pd.DataFrame({
+        "timestamp": pd.date_range("2024-01-01", periods=n, freq="1min", tz="UTC"),
+        "open": close,
+        "high": close + 5,
+        "low": close - 5,
+        "close": close,
+        "volume": np.random.randint(1000, 10000, n).astype(float),
+    })
+
+
+@pytest.fixture
+def make_candles() -> Callable[..., pd.DataFrame]:
+    """Factory for seeded random-walk candles: make_candles(n=600)."""
+    return _create_candles
+
+
+@pytest.fixture
+def candles() -> pd.DataFrame:
+    return _create_candles()
+
+
+@pytest.fixture
+def strategy_config() -> StrategyConfig:
+    return StrategyConfig(
+        name="Test",
+        approach=StrategyApproach.MEAN_REVERSION,
+        indicators=[
+            IndicatorConfig(name="rsi", enabled=True, params={"period": 14}),
+            IndicatorConfig(name="macd", enabled=True, params={}),
+            IndicatorConfig(name="bollinger", enabled=True, params={"period": 20, "std": 2.0}),
+        ],
+    )
@@ -0,0 +1,123 @@
+"""Tests for the backtest engine."""
+
+import numpy as np
+import pandas as pd
+
+from polybot.brain.backtest import (
+    MIN_CANDLES,
+    PROGRESS_UPDATES,
+    build_simulation,
+    build_trades,
+    compute_wins,
+    run_backtest,
+    run_backtests_parallel,
+    window_size_for,
+)
+from polybot.brain.models import TradeDirection, TradeResult
+
+
+class TestWindowSize:
+    def test_fifteen_minute_windows(self):
+        assert window_size_for("1m") == 15
+        assert window_size_for("5m") == 3
+        assert window_size_for("15m") == 1
+
+
+class TestComputeWins:
+    now = np.array([100.0, 100.0, 100.0, 100.0])
+    future = np.array([101.0, 99.0, 101.0, 99.0])
+    direction_up = np.array([True, True, False, False])
+
+    def test_direction_matches_move(self):
+        wins = compute_wins(self.now, self.future, self.direction_up)
+
+        assert wins.tolist() == [True, False, False, True]
+
+    def test_numpy_fallback(self, monkeypatch):
+        import polybot.brain.backtest as backtest
+
+        monkeypatch.setattr(backtest, "HAS_NUMBA", False)
+        wins = compute_wins(self.now, self.future, self.direction_up)
+
+        assert wins.tolist() == [True, False, False, True]
+
+
+class TestRunBacktest:
+    def test_grades_against_future_close(self, candles, strategy_config):
+        close = candles["close"].to_numpy()
+        ts_to_pos = {ts: pos for pos, ts in enumerate(candles["timestamp"])}
+
+        trades = build_trades(run_backtest(candles, strategy_config, window_size=3), "SIM-TEST")
+
+        assert trades
+        for trade in trades:
+            pos = ts_to_pos[trade.timestamp]
+            went_up = close[pos + 3] > close[pos]
+            correct = went_up if trade.direction == TradeDirection.UP else not went_up
+            assert (trade.result == TradeResult.WIN) == correct
+            assert trade.pnl == (1.0 if correct else 0.0)
+
+    def test_trade_ids_are_sequential(self, candles, strategy_config):
+        trades_df = run_backtest(candles, strategy_config, window_size=3)
+        trades = build_trades(trades_df, "SIM-TEST")
+
+        assert len(trades) == len(trades_df)
+        assert [t.id for t in trades[:2]] == ["SIM-TEST-T0001", "SIM-TEST-T0002"]
+        assert isinstance(trades[0].direction, TradeDirection)
+
+    def test_not_enough_candles(self, make_candles, strategy_config):
+        df = make_candles(MIN_CANDLES)
+
+        assert run_backtest(df, strategy_config, window_size=1).empty
+
+    def test_no_indicators_no_trades(self, candles, strategy_config):
+        config = strategy_config.model_copy(update={"indicators": []})
+
+        trades_df = run_backtest(candles, config, window_size=15)
+
+        assert trades_df.empty
+        assert build_trades(trades_df, "SIM-TEST") == []
+
+    def test_progress_is_throttled(self, make_candles, strategy_config):
+        calls = []
+        trades_df = run_backtest(
+            make_candles(3000), strategy_config, window_size=1,
+            on_progress=lambda fraction, n_trades: calls.append(n_trades),
+        )
+
+        assert PROGRESS_UPDATES // 2 <= len(calls) <= PROGRESS_UPDATES + 1
+        assert calls[-1] == len(trades_df)
+
+    def test_volatility_gate_drops_flat_windows(self, candles, strategy_config):
+        gated = strategy_config.model_copy(update={"min_volatility_bps": 5.0})
+
+        all_trades = run_backtest(candles, strategy_config, window_size=3)
+        gated_trades = run_backtest(candles, gated, window_size=3)
+
+        assert 0 < len(gated_trades) < len(all_trades)
+        assert set(gated_trades["market_id"]) <= set(all_trades["market_id"])
+
+
+class TestBuildSimulation:
+    def test_metrics_match_trades(self, candles, strategy_config):
+        trades_df = run_backtest(candles, strategy_config, window_size=3)
+
+        simulation = build_simulation("SIM-TEST", strategy_config, candles, trades_df)
+
+        assert simulation.metrics.total_trades == len(simulation.trades) == len(trades_df)
+        assert simulation.metrics.winning_trades == sum(
+            t.result == TradeResult.WIN for t in simulation.trades
+        )
+        assert simulation.start_time == candles["timestamp"].iloc[0]
+
+
+class TestRunBacktestsParallel:
+    def test_matches_sequential(self, make_candles, strategy_config):
+        candles = {"5m": make_candles(300), "15m": make_candles(200)}
+
+        results = run_backtests_parallel(strategy_config, candles)
+
+        assert set(results) == {"5m", "15m"}
+        for interval, df in candles.items():
+            expected = run_backtest(df, strategy_config, window_size_for(interval))
+            pd.testing.assert_frame_equal(results[interval], expected)
@@ -0,0 +1,27 @@
+"""Tests for chart helpers."""
+
+import numpy as np
+
+from polybot.ui.components.charts import lttb_indices
+
+
+class TestLttbIndices:
+    def test_short_series_untouched(self):
+        y = np.arange(10.0)
+        assert list(lttb_indices(np.arange(10), y, n_out=20)) == list(range(10))
+
+    def test_keeps_endpoints_and_count(self):
+        x = np.arange(10_000)
+        y = np.sin(x / 100)
+        kept = lttb_indices(x, y, n_out=500)
+
+        assert len(kept) == 500
+        assert kept[0] == 0 and kept[-1] == len(x) - 1
+        assert np.all(np.diff(kept) > 0)
+
+    def test_keeps_spike(self):
+        x = np.arange(5_000)
+        y = np.zeros(5_000)
+        y[1234] = 100.0
+
+        assert 1234 in lttb_indices(x, y, n_out=100)
@@ -15,156 +15,130 @@ from polybot.brain.models import (
 )
 
 
-class TestExpectedValue:
-    def test_positive_ev(self):
-        # Model thinks 60% chance, market says 45%
-        ev = calculate_expected_value(
-            model_probability=0.60,
-            market_price=0.45,
-            direction=TradeDirection.UP,
-        )
-
-        # Should be positive (we have an edge)
-        assert ev > 0
-
-    def test_negative_ev(self):
-        # Model thinks 40% chance, market says 60%
-        ev = calculate_expected_value(
-            model_probability=0.40,
-            market_price=0.60,
-            direction=TradeDirection.UP,
-        )
-
-        # Should be negative (no edge)
-        assert ev < 0
+# Shared, never mutated: tests pass list(...) copies
+UNANIMOUS_UP = (
+    IndicatorSignal(
+        name="RSI",
+        value=25,
+        interpretation="Oversold",
+        direction_bias=TradeDirection.UP,
+        strength=0.8,
+    ),
+    IndicatorSignal(
+        name="MACD",
+        value=0.01,
+        interpretation="Bullish",
+        direction_bias=TradeDirection.UP,
+        strength=0.6,
+    ),
+)
 
-    def test_fair_market(self):
-        # Model agrees with market
-        ev = calculate_expected_value(
-            model_probability=0.50,
-            market_price=0.50,
-            direction=TradeDirection.UP,
-        )
+MIXED = (
+    IndicatorSignal(
+        name="RSI",
+        value=50,
+        interpretation="Neutral",
+        direction_bias=TradeDirection.UP,
+        strength=0.3,
+    ),
+    IndicatorSignal(
+        name="MACD",
+        value=-0.01,
+        interpretation="Bearish",
+        direction_bias=TradeDirection.DOWN,
+        strength=0.7,
+    ),
+)
 
-        # Should be zero (no edge)
-        assert abs(ev) < 0.01
 
-    def test_down_direction(self):
-        # Testing DOWN direction
+class TestExpectedValue:
+    @pytest.mark.parametrize(
+        "model_probability, market_price, direction, expected_sign",
+        [
+            # Model thinks 60% chance, market says 45%: we have an edge
+            (0.60, 0.45, TradeDirection.UP, 1),
+            # Model thinks 40% chance, market says 60%: no edge
+            (0.40, 0.60, TradeDirection.UP, -1),
+            # Model agrees with market
+            (0.50, 0.50, TradeDirection.UP, 0),
+            # Model gives DOWN 60%, market says 60% UP = we buy NO at 0.40
+            (0.60, 0.60, TradeDirection.DOWN, 1),
+        ],
+        ids=["positive", "negative", "fair", "down"],
+    )
+    def test_ev_sign(self, model_probability, market_price, direction, expected_sign):
         ev = calculate_expected_value(
-            model_probability=0.40,  # 40% UP = 60% DOWN
-            market_price=0.60,       # Market says 60% UP = we buy NO at 0.40
-            direction=TradeDirection.DOWN,
+            model_probability=model_probability,
+            market_price=market_price,
+            direction=direction,
         )
 
-        # Should be positive (betting on DOWN when model says DOWN)
-        assert ev > 0
+        if expected_sign == 0:
+            assert abs(ev) < 0.01
+        else:
+            assert ev * expected_sign > 0
 
 
 class TestCombineSignals:
     def test_unanimous_up(self):
-        signals = [
-            IndicatorSignal(
-                name="RSI",
-                value=25,
-                interpretation="Oversold",
-                direction_bias=TradeDirection.UP,
-                strength=0.8,
-            ),
-            IndicatorSignal(
-                name="MACD",
-                value=0.01,
-                interpretation="Bullish",
-                direction_bias=TradeDirection.UP,
-                strength=0.6,
-            ),
-        ]
-
-        prob, direction, _ = combine_indicator_signals(signals, StrategyApproach.MEAN_REVERSION)
+        prob, direction, _, has_signal = combine_indicator_signals(
+            list(UNANIMOUS_UP), StrategyApproach.MEAN_REVERSION
+        )
 
+        assert has_signal
         assert direction == TradeDirection.UP
         assert prob > 0.5
 
     def test_mixed_signals(self):
-        signals = [
-            IndicatorSignal(
-                name="RSI",
-                value=50,
-                interpretation="Neutral",
-                direction_bias=TradeDirection.UP,
-                strength=0.3,
-            ),
-            IndicatorSignal(
-                name="MACD",
-                value=-0.01,
-                interpretation="Bearish",
-                direction_bias=TradeDirection.DOWN,
-                strength=0.7,
-            ),
-        ]
-
-        prob, direction, _ = combine_indicator_signals(signals, StrategyApproach.MOMENTUM)
-
-        # Stronger signal should win
-        assert direction == TradeDirection.DOWN
+        prob, _, reasoning, has_signal = combine_indicator_signals(
+            list(MIXED), StrategyApproach.MOMENTUM
+        )
+
+        # One vote per indicator: a split is no signal, however strong one side is
+        assert not has_signal
+        assert prob == 0.5
+        assert "divisés" in reasoning
 
     def test_no_signals(self):
-        prob, direction, reasoning = combine_indicator_signals([], StrategyApproach.AUTO)
+        prob, _, reasoning, has_signal = combine_indicator_signals([], StrategyApproach.AUTO)
 
+        assert not has_signal
         assert prob == 0.5
         assert "Aucun" in reasoning
 
 
 class TestConfidence:
-    def test_high_agreement(self):
-        signals = [
-            IndicatorSignal(name="RSI", value=25, interpretation="", direction_bias=TradeDirection.UP, strength=0.9),
-            IndicatorSignal(name="MACD", value=0.01, interpretation="", direction_bias=TradeDirection.UP, strength=0.8),
-        ]
+    @pytest.mark.parametrize(
+        "signals, model_probability, high",
+        [(UNANIMOUS_UP, 0.65, True), (MIXED, 0.5, False)],
+        ids=["high_agreement", "low_agreement"],
+    )
+    def test_agreement(self, signals, model_probability, high):
+        confidence = calculate_confidence(list(signals), model_probability)
 
-        confidence = calculate_confidence(signals, 0.65)
-
-        assert confidence > 0.6  # Should be relatively high
-
-    def test_low_agreement(self):
-        signals = [
-            IndicatorSignal(name="RSI", value=50, interpretation="", direction_bias=TradeDirection.UP, strength=0.3),
-            IndicatorSignal(name="MACD", value=-0.01, interpretation="", direction_bias=TradeDirection.DOWN, strength=0.3),
-        ]
-
-        confidence = calculate_confidence(signals, 0.5)
-
-        assert confidence < 0.6  # Should be lower
+        # Agreeing, strong indicators give a relatively high confidence
+        assert (confidence > 0.6) if high else (confidence < 0.6)
 
 
 class TestPositionSize:
-    def test_positive_ev_sizes_position(self):
-        size = calculate_position_size(
-            ev=0.10,
-            confidence=0.7,
-            capital=1000,
-            max_position_pct=0.02,
-        )
-
-        assert size > 0
-        assert size <= 20  # Max 2% of 1000
-
-    def test_negative_ev_no_position(self):
-        size = calculate_position_size(
-            ev=-0.05,
-            confidence=0.7,
-            capital=1000,
-            max_position_pct=0.02,
-        )
-
-        assert size == 0
-
-    def test_respects_max_position(self):
+    @pytest.mark.parametrize(
+        "ev, confidence, sized",
+        [
+            (0.10, 0.7, True),
+            (-0.05, 0.7, False),
+            (0.50, 0.9, True),  # Very high EV still respects the max
+        ],
+        ids=["positive_ev", "negative_ev", "respects_max"],
+    )
+    def test_position_size(self, ev, confidence, sized):
         size = calculate_position_size(
-            ev=0.50,  # Very high EV
-            confidence=0.9,
+            ev=ev,
+            confidence=confidence,
             capital=1000,
             max_position_pct=0.02,
         )
 
-        assert size <= 20  # Still respects 2% max
+        if sized:
+            assert 0 < size <= 20  # Max 2% of 1000
+        else:
+            assert size == 0
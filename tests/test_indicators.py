@@ -5,12 +5,12 @@ import numpy as np
 import pytest
 
 from polybot.brain.indicators import (
-    calculate_rsi,
-    calculate_macd,
-    calculate_bollinger,
     calculate_indicators,
+    calculate_indicators_full,
+    first_ready_row,
+    indicator_signals_at,
 )
-from polybot.brain.models import TradeDirection
+from polybot.brain.models import IndicatorSignal, TradeDirection
 
 
 def create_sample_df(n: int = 100, trend: str = "up") -> pd.DataFrame:
@@ -38,75 +38,149 @@ def create_sample_df(n: int = 100, trend: str = "up") -> pd.DataFrame:
     })
 
 
+# The generator is seeded, so each frame is built once and shared (read-only)
+@pytest.fixture(scope="module")
+def sample_dfs() -> dict[str, pd.DataFrame]:
+    return {trend: create_sample_df(100, trend=trend) for trend in ("up", "down")}
+
+
+@pytest.fixture
+def sample_df(sample_dfs) -> pd.DataFrame:
+    return sample_dfs["up"]
+
+
+SIGNAL_CONFIGS = [
+    {"name": "rsi", "enabled": True, "params": {"period": 14}},
+    {"name": "macd", "enabled": True, "params": {}},
+    {"name": "bollinger", "enabled": True, "params": {"period": 20, "std": 2.0}},
+]
+
+
+# Each indicator runs once per frame; tests read the signals from here
+@pytest.fixture(scope="module")
+def sample_signals(sample_dfs) -> dict[tuple[str, str], IndicatorSignal]:
+    signals = {}
+    for trend, df in sample_dfs.items():
+        for config, signal in zip(SIGNAL_CONFIGS, calculate_indicators(df, SIGNAL_CONFIGS)):
+            signals[config["name"], trend] = signal
+    return signals
+
+
 class TestRSI:
-    def test_rsi_calculates(self):
-        df = create_sample_df()
-        signal = calculate_rsi(df, period=14)
+    def test_rsi_calculates(self, sample_signals):
+        signal = sample_signals["rsi", "up"]
 
         assert signal.name == "RSI"
         assert 0 <= signal.value <= 100
         assert signal.strength >= 0
         assert signal.strength <= 1
 
-    def test_rsi_oversold_detection(self):
-        # Create strongly downtrending data
-        df = create_sample_df(100, trend="down")
-        signal = calculate_rsi(df, period=14)
+    @pytest.mark.parametrize("trend, above_50", [("up", True), ("down", False)])
+    def test_rsi_follows_trend(self, sample_signals, trend, above_50):
+        signal = sample_signals["rsi", trend]
 
-        # Should detect oversold or at least low RSI
-        assert signal.value < 50  # Downtrend should have lower RSI
-
-    def test_rsi_overbought_detection(self):
-        # Create strongly uptrending data
-        df = create_sample_df(100, trend="up")
-        signal = calculate_rsi(df, period=14)
-
-        # Should detect overbought or at least higher RSI
-        assert signal.value > 50  # Uptrend should have higher RSI
+        # Uptrends should have higher RSI, downtrends lower
+        assert (signal.value > 50) == above_50
 
 
 class TestMACD:
-    def test_macd_calculates(self):
-        df = create_sample_df()
-        signal = calculate_macd(df)
+    @pytest.mark.parametrize("trend", ["up", "down"])
+    def test_macd_calculates(self, sample_signals, trend):
+        signal = sample_signals["macd", trend]
 
         assert signal.name == "MACD"
-        assert signal.direction_bias in [TradeDirection.UP, TradeDirection.DOWN]
-
-    def test_macd_uptrend(self):
-        df = create_sample_df(100, trend="up")
-        signal = calculate_macd(df)
-
-        # MACD should have a direction bias (test that it calculates something)
+        # The histogram ignores a constant drift, so the bias follows the
+        # recent noise rather than the trend; only check that there is one
         assert signal.direction_bias in [TradeDirection.UP, TradeDirection.DOWN]
 
 
 class TestBollinger:
-    def test_bollinger_calculates(self):
-        df = create_sample_df()
-        signal = calculate_bollinger(df)
+    def test_bollinger_calculates(self, sample_signals):
+        signal = sample_signals["bollinger", "up"]
 
         assert signal.name == "Bollinger"
         assert 0 <= signal.value <= 1  # Position within bands
 
 
+# (value, direction_bias, strength) on the seeded sample frames, to catch
+# silent numerical drift in the indicators or pandas-ta
+GOLDEN = {
+    ("rsi", "up"): (60.39, TradeDirection.DOWN, 0.009727445758111842),
+    ("rsi", "down"): (27.21, TradeDirection.UP, 0.3197969513062093),
+    ("macd", "up"): (-0.080178, TradeDirection.DOWN, 0.15299929940739693),
+    ("macd", "down"): (-0.080178, TradeDirection.DOWN, 0.18908077457491437),
+    ("bollinger", "up"): (0.692, TradeDirection.DOWN, 0.11889542355887574),
+    ("bollinger", "down"): (0.056, TradeDirection.UP, 0.8395707867518226),
+}
+
+class TestGoldenValues:
+    @pytest.mark.parametrize("indicator, trend", list(GOLDEN))
+    def test_matches_snapshot(self, sample_signals, indicator, trend):
+        signal = sample_signals[indicator, trend]
+        value, direction_bias, strength = GOLDEN[indicator, trend]
+
+        assert signal.value == pytest.approx(value, rel=1e-6)
+        assert signal.direction_bias == direction_bias
+        assert signal.strength == pytest.approx(strength, rel=1e-6)
+
+
 class TestCalculateIndicators:
-    def test_calculates_multiple(self):
-        df = create_sample_df()
+    def test_calculates_multiple(self, sample_df):
         configs = [
             {"name": "rsi", "enabled": True, "params": {"period": 14}},
             {"name": "macd", "enabled": True, "params": {}},
             {"name": "bollinger", "enabled": False, "params": {}},
         ]
 
-        signals = calculate_indicators(df, configs)
+        signals = calculate_indicators(sample_df, configs)
 
         assert len(signals) == 2  # Only enabled indicators
         assert signals[0].name == "RSI"
         assert signals[1].name == "MACD"
 
-    def test_empty_config(self):
-        df = create_sample_df()
-        signals = calculate_indicators(df, [])
+    def test_empty_config(self, sample_df):
+        signals = calculate_indicators(sample_df, [])
 
         assert len(signals) == 0
+
+
+class TestCalculateIndicatorsFull:
+    configs = [
+        {"name": "rsi", "enabled": True, "params": {"period": 14}},
+        {"name": "macd", "enabled": True, "params": {}},
+        {"name": "bollinger", "enabled": True, "params": {"period": 20, "std": 2.0}},
+        {"name": "ema_cross", "enabled": False, "params": {}},
+    ]
+
+    def test_aligned_with_input(self, sample_df):
+        full = calculate_indicators_full(sample_df, self.configs)
+
+        assert full.index.equals(sample_df.index)
+        assert list(full.columns.unique(level=0)) == ["rsi", "macd", "bollinger"]
+
+    def test_last_row_matches_calculate_indicators(self, sample_df):
+        full = calculate_indicators_full(sample_df, self.configs)
+
+        assert indicator_signals_at(full, -1) == calculate_indicators(sample_df, self.configs)
+
+    def test_warmup_rows_insufficient_data(self, sample_df):
+        full = calculate_indicators_full(sample_df, self.configs)
+        signals = indicator_signals_at(full, 0)
+
+        assert all(s.direction_bias is None for s in signals)
+        assert all(s.interpretation == "Données insuffisantes" for s in signals)
+
+    def test_empty_config(self, sample_df):
+        full = calculate_indicators_full(sample_df, [])
+
+        assert indicator_signals_at(full, -1) == []
+        assert first_ready_row(full) == len(full)
+
+    def test_first_ready_row(self, sample_df):
+        full = calculate_indicators_full(sample_df, self.configs)
+        pos = first_ready_row(full)
+
+        before = indicator_signals_at(full, pos - 1)
+        assert all(s.interpretation == "Données insuffisantes" for s in before)
+        after = indicator_signals_at(full, pos)
+        assert any(s.interpretation != "Données insuffisantes" for s in after)
@@ -0,0 +1,79 @@
+"""Tests for paper trading session storage."""
+
+import os
+from datetime import datetime, timezone
+
+import pytest
+
+from polybot.brain.models import PaperPosition, PaperTradingSession, TradeDirection
+from polybot.storage.paper_trading import PaperTradingStore
+
+
+@pytest.fixture
+def store(tmp_path) -> PaperTradingStore:
+    return PaperTradingStore(tmp_path)
+
+
+@pytest.fixture
+def session(store, strategy_config) -> PaperTradingSession:
+    session = PaperTradingSession(
+        id=store.generate_session_id(),
+        created_at=datetime.now(timezone.utc),
+        strategy=strategy_config,
+    )
+    session.positions.append(
+        PaperPosition(
+            id=store.generate_position_id(),
+            session_id=session.id,
+            created_at=datetime.now(timezone.utc),
+            market_id="m1",
+            market_question="BTC Up or Down? — 15 min",
+            direction=TradeDirection.UP,
+            entry_odds=0.4,
+            entry_btc_price=42000.0,
+            model_probability=0.55,
+            expected_value=0.15,
+            confidence=0.6,
+        )
+    )
+    session.total_positions = 1
+    return session
+
+
+class TestPaperTradingStore:
+    def test_save_round_trip(self, store, session):
+        store.save(session)
+
+        assert store.load(session.id) == session
+        assert store.get_active_session() == session
+
+    def test_list_sessions(self, store, session):
+        store.save(session)
+
+        [summary] = store.list_sessions()
+
+        assert summary["id"] == session.id
+        assert summary["total_positions"] == 1
+        assert summary["status"] == "active"
+
+    def test_list_sessions_sees_updates(self, tmp_path, store, session):
+        store.save(session)
+        store.list_sessions()
+
+        session.status = "completed"
+        session.total_pnl = 12.5
+        store.save(session)
+        # Force a new mtime even on coarse-grained filesystems
+        path = tmp_path / f"{session.id}.json"
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        [summary] = store.list_sessions()
+        assert summary["status"] == "completed"
+        assert summary["total_pnl"] == 12.5
+
+    def test_potential_win_not_serialised(self, session):
+        [position] = session.positions
+
+        assert position.potential_win == 100.0 * (1 - 0.4) / 0.4
+        assert "potential_win" not in position.model_dump()
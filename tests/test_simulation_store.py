@@ -0,0 +1,74 @@
+"""Tests for local simulation storage."""
+
+import pytest
+
+from polybot.brain.backtest import build_simulation, run_backtest
+from polybot.storage.simulations import SimulationStore
+
+
+@pytest.fixture
+def backtest(candles, strategy_config):
+    return strategy_config, candles, run_backtest(candles, strategy_config, window_size=1)
+
+
+class TestSaveParquet:
+    def test_round_trip_matches_json_save(self, tmp_path, backtest):
+        pytest.importorskip("pyarrow")
+        config, df, trades_df = backtest
+        store = SimulationStore(tmp_path)
+        simulation = build_simulation("SIM-1", config, df, trades_df)
+
+        store.save_parquet(simulation, trades_df)
+
+        assert (tmp_path / "SIM-1.trades.parquet").exists()
+        assert store.load("SIM-1") == simulation
+
+    def test_list_all_and_delete(self, tmp_path, backtest):
+        pytest.importorskip("pyarrow")
+        config, df, trades_df = backtest
+        store = SimulationStore(tmp_path)
+        store.save_parquet(build_simulation("SIM-1", config, df, trades_df), trades_df)
+
+        [summary] = store.list_all()
+        assert summary["total_trades"] == len(trades_df)
+
+        assert store.delete("SIM-1")
+        assert list(tmp_path.iterdir()) == []
+
+    def test_legacy_json_still_loads(self, tmp_path, backtest):
+        config, df, trades_df = backtest
+        store = SimulationStore(tmp_path)
+        simulation = build_simulation("SIM-1", config, df, trades_df)
+
+        store.save(simulation)
+
+        assert [sim.id for sim in store.iter_all()] == ["SIM-1"]
+        assert store.load("SIM-1") == simulation
+
+    def test_resave_keeps_side_car(self, tmp_path, backtest):
+        pytest.importorskip("pyarrow")
+        config, df, trades_df = backtest
+        store = SimulationStore(tmp_path)
+        simulation = build_simulation("SIM-1", config, df, trades_df)
+        store.save_parquet(simulation, trades_df)
+
+        simulation.ai_explanation = "Analyse"
+        store.save(simulation)
+
+        assert "trades_file" in (tmp_path / "SIM-1.json").read_text()
+        assert store.load("SIM-1") == simulation
+
+
+class TestGetStats:
+    def test_stats_from_summaries(self, tmp_path, backtest):
+        config, df, trades_df = backtest
+        store = SimulationStore(tmp_path)
+        simulation = build_simulation("SIM-1", config, df, trades_df)
+        store.save(simulation)
+
+        stats = store.get_stats()
+
+        assert stats["total_simulations"] == 1
+        assert stats["total_trades"] == len(trades_df)
+        assert stats["total_pnl"] == simulation.final_capital - simulation.initial_capital
+        assert stats["winning_simulations"] == (1 if stats["total_pnl"] > 0 else 0)